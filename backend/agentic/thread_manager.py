@@ -48,10 +48,22 @@ class ThreadZone(str, Enum):
     @classmethod
     def from_string(cls, value: str) -> "ThreadZone":
         """Convert string to ThreadZone with fallback to DEFAULT."""
-        try:
-            return cls(value.upper().replace(" ", "-").replace("_", "-"))
-        except ValueError:
-            return cls.DEFAULT
+        zone = _ALIAS_TO_ZONE.get(value)
+        if zone is not None:
+            return zone
+        return _ALIAS_TO_ZONE.get(
+            value.upper().replace(" ", "-").replace("_", "-"), cls.DEFAULT
+        )
+
+
+# Every upper/lower-case and -/_/space spelling of each zone, so the common
+# from_string inputs resolve with a single dict lookup
+_ALIAS_TO_ZONE: Dict[str, ThreadZone] = {
+    case(zone.value.replace("-", sep)): zone
+    for zone in ThreadZone
+    for sep in ("-", "_", " ")
+    for case in (str.upper, str.lower)
+}
 
 
 # ============================================================================
@@ -0,0 +1,65 @@
+"""
+Unit Tests for utils.pdf_validator
+
+Run with: python -m pytest tests/test_pdf_validator.py -v
+"""
+
+import pytest
+import sys
+import os
+from urllib.parse import urlparse
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.pdf_validator import PDFValidator, _split_http_url
+
+
+class TestValidatePdfUrl:
+    """Test validate_pdf_url against urlparse behavior."""
+
+    def setup_method(self):
+        self.validator = PDFValidator()
+
+    @pytest.mark.parametrize("url", [
+        "https://example.com/doc.pdf",
+        "HTTP://example.com/a/b.PDF?x=1#frag",
+        "https://example.com",
+        "https://user@example.com:8080/doc.pdf",
+    ])
+    def test_fast_path_matches_urlparse(self, url):
+        parsed = urlparse(url)
+        assert _split_http_url(url) == (parsed.scheme, parsed.path)
+
+    @pytest.mark.parametrize("url", [
+        "https://example.com]/doc.pdf",
+        "https://[example.com/doc.pdf",
+    ])
+    def test_unbalanced_brackets_are_invalid(self, url):
+        result = self.validator.validate_pdf_url(url)
+        assert result["valid"] is False
+        assert "Invalid IPv6 URL" in result["errors"][0]
+
+    def test_non_ascii_host_uses_urlparse_checks(self):
+        url = "https://exa℀mple.com/doc.pdf"
+        assert _split_http_url(url) is None
+        result = self.validator.validate_pdf_url(url)
+        assert result["valid"] is False
+        assert "NFKC" in result["errors"][0]
+
+    def test_ipv6_host_is_valid(self):
+        result = self.validator.validate_pdf_url("http://[::1]/doc.pdf")
+        assert result["valid"] is True
+
+
+class TestBatchValidate:
+    """Test batch_validate on the threaded file path."""
+
+    def test_file_batch_uses_subclass_overrides(self):
+        class AlwaysValid(PDFValidator):
+            def validate_pdf_file(self, file_path, strict=False):
+                return {"valid": True, "file_path": file_path, "errors": [], "warnings": []}
+
+        summary = AlwaysValid().batch_validate(["a.pdf", "b.pdf"], validation_type='file')
+        assert summary["valid"] == 2
+        assert summary["invalid"] == 0
@@ -0,0 +1,204 @@
+"""
+Unit Tests for utils.rate_limiter
+
+Uses a patched time.monotonic that tests can move forward, so window
+limits and bucket rollover are checked without real waiting.
+
+Run with: python -m pytest tests/test_rate_limiter.py -v
+"""
+
+import pytest
+import sys
+import os
+import threading
+import time
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import rate_limiter as rate_limiter_module
+from utils.rate_limiter import RateLimiter
+
+
+class FakeTime:
+    """time module stand-in whose monotonic clock can be advanced."""
+
+    def __init__(self, start: float = 1_000_000.0):
+        self._real_start = time.monotonic()
+        self._start = start
+        self.offset = 0.0
+
+    def monotonic(self) -> float:
+        return self._start + (time.monotonic() - self._real_start) + self.offset
+
+    def advance(self, seconds: float):
+        self.offset += seconds
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeTime()
+    monkeypatch.setattr(rate_limiter_module, "time", fake)
+    return fake
+
+
+class TestWindowLimits:
+    """Test per-window admission."""
+
+    def test_minute_limit(self, clock):
+        limiter = RateLimiter(requests_per_minute=3)
+        assert [limiter.try_acquire() for _ in range(4)] == [True, True, True, False]
+        assert limiter.total_requests == 3
+        assert limiter.total_blocked == 1
+
+        clock.advance(61)
+        assert limiter.try_acquire()
+
+    def test_hour_limit(self, clock):
+        limiter = RateLimiter(requests_per_minute=100, requests_per_hour=5)
+        for _ in range(5):
+            assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+
+        clock.advance(61)  # minute window clear, hour window still full
+        assert not limiter.try_acquire()
+
+        clock.advance(3600)
+        assert limiter.try_acquire()
+
+    def test_day_limit(self, clock):
+        limiter = RateLimiter(requests_per_minute=100, requests_per_day=3)
+        for _ in range(3):
+            assert limiter.try_acquire()
+
+        clock.advance(3601)
+        assert not limiter.try_acquire()
+
+        clock.advance(86400)
+        assert limiter.try_acquire()
+
+    def test_bucket_rollover_releases_only_expired_requests(self, clock):
+        limiter = RateLimiter(requests_per_minute=2)
+        assert limiter.try_acquire()
+        clock.advance(30)
+        assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+
+        # The first request's bucket has left the window, the second's has not
+        clock.advance(31)
+        assert limiter.get_stats()["current_minute_count"] == 1
+        assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+
+    def test_time_until_available(self, clock):
+        limiter = RateLimiter(requests_per_minute=1)
+        assert limiter.get_stats()["time_until_available"] == 0.0
+        limiter.try_acquire()
+        assert 59 <= limiter.get_stats()["time_until_available"] <= 60
+
+
+class TestAcquire:
+    """Test blocking acquisition."""
+
+    def test_acquire_times_out(self, clock):
+        limiter = RateLimiter(requests_per_minute=1)
+        assert limiter.acquire(timeout=1)
+
+        started = time.monotonic()
+        assert not limiter.acquire(timeout=0.05)
+        assert time.monotonic() - started < 1.0
+
+    def test_reset_wakes_waiters(self, clock):
+        limiter = RateLimiter(requests_per_minute=1)
+        assert limiter.acquire()
+
+        result = {}
+        waiter = threading.Thread(target=lambda: result.update(ok=limiter.acquire(timeout=5)))
+        waiter.start()
+        time.sleep(0.1)
+        assert "ok" not in result
+
+        started = time.monotonic()
+        limiter.reset()
+        waiter.join(2)
+        assert result.get("ok") is True
+        assert time.monotonic() - started < 1.0
+
+
+class TestBatchAcquire:
+    """Test try_acquire_n / acquire_n."""
+
+    def test_try_acquire_n_is_all_or_nothing(self, clock):
+        limiter = RateLimiter(requests_per_minute=10)
+        assert limiter.try_acquire_n(7)
+        assert not limiter.try_acquire_n(4)
+        assert limiter.get_stats()["current_minute_count"] == 7
+        assert limiter.try_acquire_n(3)
+        assert limiter.total_requests == 10
+
+    def test_batch_respects_every_window(self, clock):
+        limiter = RateLimiter(requests_per_minute=10, requests_per_hour=12)
+        assert limiter.try_acquire_n(10)
+        clock.advance(61)
+        assert not limiter.try_acquire_n(3)
+        assert limiter.try_acquire_n(2)
+
+    @pytest.mark.parametrize("n", [0, 11])
+    def test_impossible_batch_sizes_raise(self, clock, n):
+        limiter = RateLimiter(requests_per_minute=10)
+        with pytest.raises(ValueError):
+            limiter.try_acquire_n(n)
+        with pytest.raises(ValueError):
+            limiter.acquire_n(n)
+
+    def test_batch_larger_than_hour_limit_raises(self, clock):
+        limiter = RateLimiter(requests_per_minute=100, requests_per_hour=20)
+        with pytest.raises(ValueError):
+            limiter.acquire_n(21)
+
+    def test_acquire_n_times_out(self, clock):
+        limiter = RateLimiter(requests_per_minute=10)
+        assert limiter.acquire_n(8, timeout=1)
+        assert not limiter.acquire_n(3, timeout=0.05)
+        assert limiter.acquire_n(2, timeout=0.05)
+
+
+class TestStatsLockfree:
+    """Test get_stats_lockfree."""
+
+    def test_does_not_wait_for_held_lock(self, clock):
+        limiter = RateLimiter(requests_per_minute=5)
+        limiter.try_acquire_n(2)
+
+        held = threading.Event()
+        release = threading.Event()
+
+        def hold_lock():
+            with limiter._lock:
+                held.set()
+                release.wait(5)
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        held.wait(1)
+        try:
+            started = time.monotonic()
+            stats = limiter.get_stats_lockfree()
+            assert time.monotonic() - started < 0.5
+        finally:
+            release.set()
+            holder.join(1)
+
+        assert stats["current_minute_count"] == 2
+        assert stats["total_requests"] == 2
+
+    def test_matches_get_stats_when_unlocked(self, clock):
+        limiter = RateLimiter(requests_per_minute=5, requests_per_day=50)
+        limiter.try_acquire_n(3)
+        locked = limiter.get_stats()
+        lockfree = limiter.get_stats_lockfree()
+        for key in ("current_minute_count", "current_day_count", "total_requests", "total_blocked"):
+            assert locked[key] == lockfree[key]
@@ -0,0 +1,106 @@
+"""
+Unit Tests for utils.retry
+
+Run with: python -m pytest tests/test_retry.py -v
+"""
+
+import pytest
+import sys
+import os
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import retry
+from utils.retry import _get_status_attr, exponential_backoff_retry, retry_on_rate_limit
+
+
+class ApiError(Exception):
+    """Exception whose instances carry the status on either attribute."""
+
+    def __init__(self, message, status=None, status_code=None):
+        super().__init__(message)
+        if status is not None:
+            self.status = status
+        if status_code is not None:
+            self.status_code = status_code
+
+
+@pytest.fixture(autouse=True)
+def clear_status_cache():
+    retry._STATUS_ATTR_CACHE.clear()
+    yield
+    retry._STATUS_ATTR_CACHE.clear()
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(retry.time, "sleep", lambda seconds: None)
+
+
+class TestGetStatusAttr:
+    """The per-type cache must not hide a status the full probe would find."""
+
+    def test_reads_either_attribute(self):
+        assert _get_status_attr(ApiError("x", status=503)) == 503
+        assert _get_status_attr(ApiError("x", status_code=429)) == 429
+
+    def test_cached_attribute_missing_on_instance(self):
+        assert _get_status_attr(ApiError("x", status=503)) == 503
+        # Same type, status now on the other attribute
+        assert _get_status_attr(ApiError("x", status_code=404)) == 404
+
+    def test_type_first_seen_without_status(self):
+        assert _get_status_attr(ApiError("x")) is None
+        assert _get_status_attr(ApiError("x", status=500)) == 500
+
+    def test_status_takes_precedence(self):
+        assert _get_status_attr(ApiError("x", status=500, status_code=404)) == 500
+
+    def test_plain_exception(self):
+        assert _get_status_attr(ValueError("boom")) is None
+
+
+class TestExponentialBackoffRetry:
+    """Retry classification after the cache has seen the exception type."""
+
+    def test_client_error_after_cached_type_is_not_retried(self, no_sleep):
+        _get_status_attr(ApiError("x", status=503))
+        calls = []
+
+        def fail():
+            calls.append(1)
+            raise ApiError("bad request", status_code=400)
+
+        with pytest.raises(ApiError):
+            exponential_backoff_retry(fail, max_retries=3)
+        assert len(calls) == 1
+
+    def test_server_error_is_retried(self, no_sleep):
+        calls = []
+
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ApiError("unavailable", status=503)
+            return "ok"
+
+        assert exponential_backoff_retry(flaky, max_retries=5) == "ok"
+        assert len(calls) == 3
+
+
+class TestRetryOnRateLimit:
+    """retry_on_rate_limit only retries 429s."""
+
+    def test_rate_limit_on_status_code_is_retried(self, no_sleep):
+        _get_status_attr(ApiError("x", status=500))
+        calls = []
+
+        def limited():
+            calls.append(1)
+            if len(calls) < 2:
+                raise ApiError("slow down", status_code=429)
+            return "ok"
+
+        assert retry_on_rate_limit(limited, max_retries=3) == "ok"
+        assert len(calls) == 2
@@ -0,0 +1,114 @@
+"""
+Unit Tests for utils.timeout_utils
+
+Run with: python -m pytest tests/test_timeout_utils.py -v
+"""
+
+import pytest
+import sys
+import os
+import threading
+import time
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.timeout_utils import TimeoutContext, TimeoutException, _DaemonPool, with_timeout
+
+
+class TestDaemonPool:
+    """Test the worker pool behind with_timeout."""
+
+    def test_idle_worker_is_reused(self):
+        pool = _DaemonPool()
+        first = pool.submit(threading.get_ident).result(timeout=1)
+        # Give the worker a moment to mark itself idle again
+        time.sleep(0.05)
+        second = pool.submit(threading.get_ident).result(timeout=1)
+        assert first == second
+
+    def test_workers_are_daemon_threads(self):
+        pool = _DaemonPool()
+        assert pool.submit(lambda: threading.current_thread().daemon).result(timeout=1)
+
+    def test_hung_call_does_not_starve_later_calls(self):
+        pool = _DaemonPool()
+        release = threading.Event()
+        hung = pool.submit(release.wait, 5)
+        try:
+            assert pool.submit(lambda: "ran").result(timeout=1) == "ran"
+            assert not hung.done()
+        finally:
+            release.set()
+        assert hung.result(timeout=1) is True
+
+    def test_idle_workers_retire(self):
+        pool = _DaemonPool(idle_timeout=0.05)
+        worker = pool.submit(threading.current_thread).result(timeout=1)
+        worker.join(1)
+        assert not worker.is_alive()
+        assert pool._idle == 0
+        # A retired pool still serves new calls on a fresh worker
+        assert pool.submit(lambda: 42).result(timeout=1) == 42
+
+    def test_exception_reaches_future(self):
+        pool = _DaemonPool()
+
+        def fail():
+            raise KeyError("missing")
+
+        future = pool.submit(fail)
+        with pytest.raises(KeyError, match="missing"):
+            future.result(timeout=1)
+        # The worker survives and keeps serving
+        assert pool.submit(lambda: "ok").result(timeout=1) == "ok"
+
+
+class TestWithTimeout:
+    """Test the with_timeout decorator."""
+
+    def test_returns_result(self):
+        @with_timeout(1)
+        def double(x):
+            return x * 2
+
+        assert double(4) == 8
+
+    def test_raises_on_timeout(self):
+        release = threading.Event()
+
+        @with_timeout(0.05)
+        def slow():
+            release.wait(5)
+
+        try:
+            with pytest.raises(TimeoutException):
+                slow()
+        finally:
+            release.set()
+
+    def test_propagates_exceptions(self):
+        @with_timeout(1)
+        def fail():
+            raise ValueError("bad")
+
+        with pytest.raises(ValueError, match="bad"):
+            fail()
+
+
+class TestTimeoutContext:
+    """Test the cooperative TimeoutContext."""
+
+    def test_check_passes_before_deadline(self):
+        with TimeoutContext(5) as ctx:
+            ctx.check()
+
+    def test_check_raises_after_deadline(self):
+        with TimeoutContext(0.01) as ctx:
+            time.sleep(0.02)
+            with pytest.raises(TimeoutException):
+                ctx.check()
+
+    def test_check_before_enter(self):
+        ctx = TimeoutContext(5)
+        ctx.check()
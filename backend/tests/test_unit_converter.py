@@ -0,0 +1,81 @@
+"""
+Unit Tests for utils.unit_converter
+
+Run with: python -m pytest tests/test_unit_converter.py -v
+"""
+
+import pytest
+import sys
+import os
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import unit_converter
+from utils.unit_converter import IndustrialUnitConverter
+
+
+PRODUCT_RANGES = [
+    # Same unit: contains, overlaps, disjoint
+    "-20 to 150 °C",
+    "50-200 °C",
+    "200...300 °C",
+    # Mixed units in one call
+    "32-212 °F",
+    "0-400 K",
+    "250-300 K",
+    "0-10 bar",
+    "0-150 psi",
+    "0-100 gpm",
+    # Zero-width product ranges
+    "50-50 °C",
+    "100-100 °C",
+    "500-500 °C",
+    # Unparseable entries
+    "",
+    "n/a",
+    "about 100 °C",
+]
+
+REQUIRED_RANGES = [
+    "0-100 °C",
+    "32-212 °F",
+    # Zero-width required range
+    "50-50 °C",
+    "0-10 bar",
+    # Unparseable required range
+    "ambient",
+]
+
+
+@pytest.fixture
+def converter():
+    return IndustrialUnitConverter()
+
+
+class TestRangesCompatibleBulk:
+    """ranges_compatible_bulk must agree with per-item ranges_compatible."""
+
+    @pytest.mark.parametrize("req_range", REQUIRED_RANGES)
+    def test_matches_per_item(self, converter, req_range):
+        pytest.importorskip("numpy")
+        assert unit_converter.NUMPY_AVAILABLE
+
+        bulk = converter.ranges_compatible_bulk(req_range, PRODUCT_RANGES)
+        expected = [converter.ranges_compatible(req_range, p) for p in PRODUCT_RANGES]
+
+        assert len(bulk) == len(expected)
+        for product_range, got, want in zip(PRODUCT_RANGES, bulk, expected):
+            assert got == want, product_range
+
+    @pytest.mark.parametrize("req_range", REQUIRED_RANGES)
+    def test_fallback_matches_per_item(self, converter, req_range, monkeypatch):
+        monkeypatch.setattr(unit_converter, "NUMPY_AVAILABLE", False)
+
+        bulk = converter.ranges_compatible_bulk(req_range, PRODUCT_RANGES)
+        expected = [converter.ranges_compatible(req_range, p) for p in PRODUCT_RANGES]
+
+        assert bulk == expected
+
+    def test_empty_product_list(self, converter):
+        assert converter.ranges_compatible_bulk("0-100 °C", []) == []
@@ -0,0 +1,94 @@
+"""
+Unit Tests for utils.validation_utils
+
+Run with: python -m pytest tests/test_validation_utils.py -v
+"""
+
+import pytest
+import sys
+import os
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import BaseModel, Field
+
+from utils.validation_utils import (
+    ValidationException,
+    validate_product_type,
+    validate_tool_input,
+    validate_vendor_list,
+)
+
+
+class TestValidateVendorList:
+    """Test validate_vendor_list fast and slow paths."""
+
+    def test_accepts_vendor_names(self):
+        validate_vendor_list(["ABB", " Emerson "])
+
+    @pytest.mark.parametrize("blank", ["", "   ", "\t\n", "\x1c", "\x1f"])
+    def test_rejects_names_blank_after_strip(self, blank):
+        with pytest.raises(ValidationException, match="empty vendor name"):
+            validate_vendor_list(["ABB", blank])
+
+    def test_rejects_non_string_item(self):
+        with pytest.raises(ValidationException, match=r"vendors\[1\] must be str"):
+            validate_vendor_list(["ABB", 1])
+
+    def test_rejects_empty_list(self):
+        with pytest.raises(ValidationException, match="at least 1"):
+            validate_vendor_list([])
+
+
+class TestValidateToolInput:
+    """Test the kwargs validate_tool_input passes to the wrapped tool."""
+
+    def test_passes_validated_fields(self):
+        class Schema(BaseModel):
+            vendor: str
+            limit: int = 5
+
+        @validate_tool_input(Schema)
+        def tool(**kwargs):
+            return kwargs
+
+        assert tool(vendor="ABB") == {"vendor": "ABB", "limit": 5}
+
+    def test_drops_excluded_fields(self):
+        class Schema(BaseModel):
+            vendor: str
+            secret: str = Field(default="", exclude=True)
+
+        @validate_tool_input(Schema)
+        def tool(**kwargs):
+            return kwargs
+
+        assert tool(vendor="ABB", secret="s3cr3t") == {"vendor": "ABB"}
+
+    def test_invalid_input_raises(self):
+        class Schema(BaseModel):
+            limit: int
+
+        @validate_tool_input(Schema)
+        def tool(**kwargs):
+            return kwargs
+
+        with pytest.raises(ValidationException):
+            tool(limit="many")
+
+
+class TestValidateProductType:
+    """Test validate_product_type character checks."""
+
+    def test_accepts_plain_product_type(self):
+        validate_product_type("pressure transmitter")
+
+    @pytest.mark.parametrize("char", ['<', '>', ';', '&', '|', '$'])
+    def test_rejects_invalid_character(self, char):
+        with pytest.raises(ValidationException, match=f"invalid character: \\{char}"):
+            validate_product_type(f"flow{char}meter")
+
+    def test_reports_first_invalid_character_in_check_order(self):
+        with pytest.raises(ValidationException, match="invalid character: <"):
+            validate_product_type("a$b<c")
@@ -0,0 +1,159 @@
+"""
+Unit Tests for utils.workflow_sync
+
+Run with: python -m pytest tests/test_workflow_sync.py -v
+"""
+
+import inspect
+import pytest
+import sys
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.workflow_sync import (
+    StateTransaction,
+    _snapshot_state,
+    parallel_map,
+    with_workflow_lock,
+)
+
+
+class CustomCopy:
+    """Object whose deepcopy differs from a pickle round-trip."""
+
+    def __init__(self):
+        self.copied = False
+
+    def __deepcopy__(self, memo):
+        clone = CustomCopy()
+        clone.copied = True
+        return clone
+
+
+class TestSnapshotState:
+    """_snapshot_state must copy the way copy.deepcopy does."""
+
+    def test_plain_state_is_deep_copied(self):
+        state = {"messages": [{"role": "user", "tags": ["a"]}], "count": 1, "pair": (1, 2)}
+        snapshot = _snapshot_state(state)
+
+        assert snapshot == state
+        assert snapshot["messages"] is not state["messages"]
+        assert snapshot["messages"][0] is not state["messages"][0]
+
+    def test_shared_references_are_preserved(self):
+        shared = [1, 2]
+        snapshot = _snapshot_state({"a": shared, "b": shared})
+
+        assert snapshot["a"] is snapshot["b"]
+
+    def test_deepcopy_hook_is_honoured(self):
+        snapshot = _snapshot_state({"nested": [{"obj": CustomCopy()}]})
+
+        assert snapshot["nested"][0]["obj"].copied
+
+    def test_builtin_subclass_keeps_type(self):
+        snapshot = _snapshot_state({"ordered": OrderedDict(a=1, b=2)})
+
+        assert type(snapshot["ordered"]) is OrderedDict
+        assert list(snapshot["ordered"]) == ["a", "b"]
+
+
+class TestStateTransaction:
+    """Test rollback through the snapshot."""
+
+    def test_rollback_restores_nested_values(self):
+        state = {"products": [{"name": "a"}], "step": 1}
+
+        with pytest.raises(ValueError):
+            with StateTransaction(state):
+                state["products"][0]["name"] = "b"
+                state["step"] = 2
+                state["extra"] = True
+                raise ValueError("boom")
+
+        assert state == {"products": [{"name": "a"}], "step": 1}
+
+    def test_rollback_with_custom_objects(self):
+        obj = CustomCopy()
+        state = {"obj": obj, "step": 1}
+
+        with pytest.raises(ValueError):
+            with StateTransaction(state):
+                state["step"] = 2
+                raise ValueError("boom")
+
+        assert state["step"] == 1
+        assert state["obj"].copied
+
+
+def _invert(x):
+    return 1 / x
+
+
+class TestParallelMap:
+    """Results line up with inputs; failures become None plus an error entry."""
+
+    def test_results_in_input_order(self):
+        results, errors = parallel_map(lambda x: x * 2, range(20), max_workers=4)
+
+        assert results == [x * 2 for x in range(20)]
+        assert errors == []
+
+    def test_failed_items_keep_their_slot(self):
+        results, errors = parallel_map(_invert, [1, 0, 4, 0])
+
+        assert results == [1.0, None, 0.25, None]
+        assert [e["context"] for e in errors] == [
+            {"input": 0, "index": 1},
+            {"input": 0, "index": 3},
+        ]
+        assert all(e["type"] == "ZeroDivisionError" for e in errors)
+
+    def test_uses_given_executor(self):
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            results, errors = parallel_map(_invert, [2, 4], executor=ex)
+            # Executor is left running for the caller
+            assert ex.submit(_invert, 1).result() == 1.0
+
+        assert results == [0.5, 0.25]
+        assert errors == []
+
+
+class TestWithWorkflowLock:
+    """The wrapper must keep the wrapped function's call signature."""
+
+    @staticmethod
+    def _state_fn(state: dict, step: int = 0):
+        return state["session_id"], step
+
+    @staticmethod
+    def _kwarg_fn(query, session_id=None):
+        return query, session_id
+
+    @staticmethod
+    def _other_fn(*args, **kwargs):
+        return args, kwargs
+
+    @pytest.mark.parametrize("fn", ["_state_fn", "_kwarg_fn", "_other_fn"])
+    def test_signature_is_preserved(self, fn):
+        func = getattr(self, fn)
+        wrapped = with_workflow_lock()(func)
+
+        assert inspect.signature(wrapped) == inspect.signature(func)
+        # The wrapper itself adds no parameters of its own
+        assert list(inspect.signature(wrapped, follow_wrapped=False).parameters) == ["args", "kwargs"]
+
+    def test_keywords_reach_the_wrapped_function(self):
+        wrapped = with_workflow_lock()(self._other_fn)
+
+        assert wrapped(session_id="s1", _wf_lock="x") == ((), {"session_id": "s1", "_wf_lock": "x"})
+
+    def test_calls_through_lock(self):
+        assert with_workflow_lock()(self._state_fn)({"session_id": "s1"}, step=2) == ("s1", 2)
+        assert with_workflow_lock()(self._kwarg_fn)("q", session_id="s1") == ("q", "s1")
+        assert with_workflow_lock()(self._other_fn)(session_id="s1") == ((), {"session_id": "s1"})
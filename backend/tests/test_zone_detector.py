@@ -0,0 +1,248 @@
+"""
+Unit Tests for utils.zone_detector
+
+Run with: python -m pytest tests/test_zone_detector.py -v
+"""
+
+import asyncio
+import pytest
+import time
+import sys
+import os
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.zone_detector import ThreadZone, ZoneDetector
+
+
+class TestMapToZone:
+    """Test geo data to zone mapping."""
+
+    def setup_method(self):
+        self.detector = ZoneDetector(geoip_db_path="/nonexistent.mmdb")
+
+    @pytest.mark.parametrize("geo_data, zone", [
+        ({"country": "US", "region": "CA"}, ThreadZone.US_WEST),
+        ({"country": "US", "region": "NY"}, ThreadZone.US_EAST),
+        ({"country": "DE"}, ThreadZone.EU_CENTRAL),
+        ({"country": "BR", "continent": "SA"}, ThreadZone.US_EAST),
+        ({}, ThreadZone.DEFAULT),
+    ])
+    def test_mapping(self, geo_data, zone):
+        assert self.detector._map_to_zone(geo_data) == zone
+
+    def test_null_fields_fall_through(self):
+        geo_data = {"country": None, "region": None, "continent": None}
+        assert self.detector._map_to_zone(geo_data) == ThreadZone.DEFAULT
+
+
+# Raw provider payloads for the same Texas IP
+IPINFO_TEXAS = {
+    "ip": "8.8.4.4", "city": "Dallas", "region": "Texas", "country": "US",
+    "loc": "32.7,-96.8", "timezone": "America/Chicago",
+}
+IPAPI_TEXAS = {
+    "status": "success", "countryCode": "US", "region": "TX",
+    "regionName": "Texas", "city": "Dallas", "timezone": "America/Chicago",
+    "query": "8.8.4.4",
+}
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+
+    def json(self):
+        return self.payload
+
+
+class FakeSession:
+    """Stands in for requests.Session; answers per provider after a delay."""
+
+    def __init__(self, ipinfo=IPINFO_TEXAS, ipapi=IPAPI_TEXAS, delays=None):
+        self.ipinfo = ipinfo
+        self.ipapi = ipapi
+        self.delays = delays or {}
+        self.posts = []
+
+    def get(self, url, params=None, timeout=None):
+        provider = "ipinfo" if "ipinfo.io" in url else "ipapi"
+        time.sleep(self.delays.get(provider, 0))
+        return FakeResponse(self.ipinfo if provider == "ipinfo" else self.ipapi)
+
+    def post(self, url, json=None, timeout=None):
+        self.posts.append(json)
+        return FakeResponse([
+            dict(self.ipapi, query=item["query"]) for item in json
+        ])
+
+
+def make_detector(session=None, mmdb=None):
+    detector = ZoneDetector(geoip_db_path="/nonexistent.mmdb", timeout_seconds=2)
+    if session is not None:
+        detector._session = session
+    detector._mmdb = mmdb
+    return detector
+
+
+class TestProviderNormalization:
+    """Both web providers must resolve the same IP to the same zone."""
+
+    def test_providers_normalize_to_same_geo_data(self):
+        ipinfo = ZoneDetector._parse_ipinfo(IPINFO_TEXAS)
+        ipapi = ZoneDetector._parse_ipapi(IPAPI_TEXAS)
+        for key in ("country", "region", "continent"):
+            assert ipinfo[key] == ipapi[key]
+        assert ipinfo["region"] == "TX"
+        assert ipinfo["continent"] == "NA"
+
+    @pytest.mark.parametrize("delays", [
+        {"ipinfo": 0.0, "ipapi": 0.2},
+        {"ipinfo": 0.2, "ipapi": 0.0},
+    ])
+    def test_zone_independent_of_provider_order(self, delays):
+        detector = make_detector(FakeSession(delays=delays))
+        assert detector.detect_zone("8.8.4.4") == ThreadZone.US_EAST
+
+    def test_failed_provider_falls_back_to_other(self):
+        session = FakeSession(ipinfo={}, delays={"ipapi": 0.1})
+        assert make_detector(session).detect_zone("8.8.4.4") == ThreadZone.US_EAST
+
+    def test_continent_from_timezone(self):
+        geo_data = ZoneDetector._parse_ipinfo({"country": "BR", "timezone": "America/Sao_Paulo"})
+        assert make_detector()._map_to_zone(geo_data) == ThreadZone.US_EAST
+
+
+class FakeAioResponse:
+    def __init__(self, payload):
+        self.status = 200
+        self.payload = payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def json(self, content_type=None):
+        return self.payload
+
+
+class FakeAioSession:
+    """Stands in for aiohttp.ClientSession with per-provider delays."""
+
+    closed = False
+
+    def __init__(self, delays):
+        self.delays = delays
+
+    def get(self, url, params=None):
+        provider = "ipinfo" if "ipinfo.io" in url else "ipapi"
+        payload = IPINFO_TEXAS if provider == "ipinfo" else IPAPI_TEXAS
+        delay = self.delays.get(provider, 0)
+
+        class _Delayed(FakeAioResponse):
+            async def __aenter__(inner):
+                await asyncio.sleep(delay)
+                return inner
+
+        return _Delayed(payload)
+
+
+class TestDetectZoneAsync:
+    """Test the async lookup path."""
+
+    def setup_method(self):
+        pytest.importorskip("aiohttp")
+
+    @pytest.mark.parametrize("delays", [
+        {"ipinfo": 0.0, "ipapi": 0.1},
+        {"ipinfo": 0.1, "ipapi": 0.0},
+    ])
+    def test_zone_independent_of_provider_order(self, delays):
+        detector = make_detector()
+
+        async def run():
+            detector._aio_sessions[asyncio.get_running_loop()] = FakeAioSession(delays)
+            return await detector.detect_zone_async("8.8.4.4")
+
+        assert asyncio.run(run()) == ThreadZone.US_EAST
+
+    def test_session_reused_within_loop(self):
+        detector = make_detector()
+
+        async def run():
+            first = detector._get_aio_session()
+            second = detector._get_aio_session()
+            await detector.aclose()
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first is second
+        assert first.closed
+
+    def test_local_ip_skips_lookup(self):
+        detector = make_detector()
+        assert asyncio.run(detector.detect_zone_async("127.0.0.1")) == detector._get_default_zone()
+
+
+class TestDetectZones:
+    """Test the batch lookup path."""
+
+    def test_batch_resolves_local_cached_and_remote(self):
+        session = FakeSession()
+        detector = make_detector(session)
+        detector._cache.set("9.9.9.9", {"zone": ThreadZone.EU_WEST})
+
+        zones = detector.detect_zones(["127.0.0.1", "9.9.9.9", "8.8.4.4", "8.8.4.4"])
+
+        assert zones["127.0.0.1"] == detector._get_default_zone()
+        assert zones["9.9.9.9"] == ThreadZone.EU_WEST
+        assert zones["8.8.4.4"] == ThreadZone.US_EAST
+        # Only the uncached public IP is sent, once
+        assert session.posts == [[{"query": "8.8.4.4"}]]
+        assert detector._cache.get("8.8.4.4")["zone"] == ThreadZone.US_EAST
+
+    def test_batch_chunks_at_limit(self):
+        session = FakeSession()
+        detector = make_detector(session)
+        ips = [f"8.8.{i // 256}.{i % 256}" for i in range(ZoneDetector.IPAPI_BATCH_SIZE + 1)]
+
+        zones = detector.detect_zones(ips)
+
+        assert [len(batch) for batch in session.posts] == [ZoneDetector.IPAPI_BATCH_SIZE, 1]
+        assert set(zones.values()) == {ThreadZone.US_EAST}
+
+
+class FakeMmdb:
+    def __init__(self, records):
+        self.records = records
+
+    def get(self, ip):
+        return self.records.get(ip)
+
+
+class TestMmdbLookup:
+    """Test the local GeoLite2 lookup path."""
+
+    def test_mmdb_answers_without_network(self):
+        session = FakeSession(ipinfo={}, ipapi={})
+        mmdb = FakeMmdb({"8.8.4.4": {
+            "country": {"iso_code": "US"},
+            "continent": {"code": "NA"},
+            "subdivisions": [{"iso_code": "CA"}],
+        }})
+        detector = make_detector(session, mmdb)
+        assert detector.detect_zone("8.8.4.4") == ThreadZone.US_WEST
+
+    def test_country_database_record(self):
+        mmdb = FakeMmdb({"1.1.1.1": {"country": {"iso_code": "JP"}, "continent": {"code": "AS"}}})
+        detector = make_detector(mmdb=mmdb)
+        assert detector._lookup_mmdb("1.1.1.1")["region"] == ""
+        assert detector.detect_zone("1.1.1.1") == ThreadZone.ASIA_PACIFIC
+
+    def test_missing_record_falls_back_to_providers(self):
+        detector = make_detector(FakeSession(), FakeMmdb({}))
+        assert detector.detect_zone("8.8.4.4") == ThreadZone.US_EAST
@@ -11,6 +11,7 @@ or experiencing issues. The circuit breaker has three states:
 This saves time, API quota, and provides better error messages to users.
 """
 
+import functools
 import logging
 import time
 import threading
@@ -49,6 +50,11 @@ class CircuitBreaker:
         except CircuitBreakerError:
             # Circuit is open, service is down
             return fallback_response()
+
+        # Or wrap the function once at definition time
+        @breaker
+        def expensive_api_call(arg1, arg2):
+            ...
     """
 
     def __init__(
@@ -146,6 +152,42 @@ class CircuitBreaker:
             self._success_count = 0
             self._half_open_calls = 0
 
+    def _before_call(self):
+        """
+        Admit a call or fail fast. Must be called with the lock held.
+
+        Raises:
+            CircuitBreakerError: If circuit is OPEN or HALF_OPEN limit is reached
+        """
+        self._total_calls += 1
+
+        # Check circuit state
+        current_state = self.state
+
+        if current_state == CircuitState.OPEN:
+            # Fail fast - don't even try
+            logger.warning(
+                f"[CIRCUIT_BREAKER:{self.name}] Request rejected - Circuit is OPEN "
+                f"(will retry in {self._time_until_reset():.0f}s)"
+            )
+            raise CircuitBreakerError(
+                f"Circuit breaker '{self.name}' is OPEN. "
+                f"Service is unavailable. Retry in {self._time_until_reset():.0f}s"
+            )
+
+        if current_state == CircuitState.HALF_OPEN:
+            # Limit calls in HALF_OPEN state
+            if self._half_open_calls >= self.half_open_max_calls:
+                logger.warning(
+                    f"[CIRCUIT_BREAKER:{self.name}] Request rejected - "
+                    f"HALF_OPEN limit reached ({self._half_open_calls}/{self.half_open_max_calls})"
+                )
+                raise CircuitBreakerError(
+                    f"Circuit breaker '{self.name}' is in HALF_OPEN state. "
+                    f"Testing recovery, please retry in a few seconds."
+                )
+            self._half_open_calls += 1
+
     def call(self, func: Callable, *args, **kwargs) -> Any:
         """
         Execute function through circuit breaker.
@@ -163,34 +205,7 @@ class CircuitBreaker:
             Exception: Original exception from function
         """
         with self._lock:
-            self._total_calls += 1
-
-            # Check circuit state
-            current_state = self.state
-
-            if current_state == CircuitState.OPEN:
-                # Fail fast - don't even try
-                logger.warning(
-                    f"[CIRCUIT_BREAKER:{self.name}] Request rejected - Circuit is OPEN "
-                    f"(will retry in {self._time_until_reset():.0f}s)"
-                )
-                raise CircuitBreakerError(
-                    f"Circuit breaker '{self.name}' is OPEN. "
-                    f"Service is unavailable. Retry in {self._time_until_reset():.0f}s"
-                )
-
-            if current_state == CircuitState.HALF_OPEN:
-                # Limit calls in HALF_OPEN state
-                if self._half_open_calls >= self.half_open_max_calls:
-                    logger.warning(
-                        f"[CIRCUIT_BREAKER:{self.name}] Request rejected - "
-                        f"HALF_OPEN limit reached ({self._half_open_calls}/{self.half_open_max_calls})"
-                    )
-                    raise CircuitBreakerError(
-                        f"Circuit breaker '{self.name}' is in HALF_OPEN state. "
-                        f"Testing recovery, please retry in a few seconds."
-                    )
-                self._half_open_calls += 1
+            self._before_call()
 
         # Execute the function
         try:
@@ -215,12 +230,66 @@ class CircuitBreaker:
             )
             raise
 
+    def __call__(self, func: Callable) -> Callable:
+        """
+        Use the circuit breaker as a decorator.
+
+        Binds the lock and hooks once at decoration time, so each protected
+        call skips the extra frame and argument repacking of call().
+
+        Usage:
+            @get_gemini_circuit_breaker()
+            def invoke_gemini(prompt):
+                ...
+        """
+        lock = self._lock
+        expected_exception = self.expected_exception
+        before_call = self._before_call
+        on_success = self._on_success
+        on_failure = self._on_failure
+        name = self.name
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with lock:
+                before_call()
+
+            try:
+                result = func(*args, **kwargs)
+            except expected_exception:
+                with lock:
+                    on_failure()
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"[CIRCUIT_BREAKER:{name}] Unexpected exception (not counted): {type(e).__name__}"
+                )
+                raise
+
+            with lock:
+                on_success()
+            return result
+
+        return wrapper
+
     def _on_success(self):
         """Handle successful call"""
         self._total_successes += 1
+
+        if self._state is CircuitState.CLOSED:
+            # Healthy fast path - only reset a non-zero failure streak
+            if self._failure_count:
+                logger.debug(
+                    "[CIRCUIT_BREAKER:%s] Success - resetting failure count (was %d)",
+                    self.name, self._failure_count
+                )
+                self._failure_count = 0
+            return
+
+        # Success streak only matters while testing recovery in HALF_OPEN
         self._success_count += 1
 
-        if self._state == CircuitState.HALF_OPEN:
+        if self._state is CircuitState.HALF_OPEN:
             # Recovering - check if we can close the circuit
             logger.info(
                 f"[CIRCUIT_BREAKER:{self.name}] HALF_OPEN success "
@@ -228,14 +297,6 @@ class CircuitBreaker:
             )
             if self._success_count >= self.half_open_max_calls:
                 self._transition_to_closed()
-        elif self._state == CircuitState.CLOSED:
-            # Reset failure count on success
-            if self._failure_count > 0:
-                logger.debug(
-                    f"[CIRCUIT_BREAKER:{self.name}] Success - resetting failure count "
-                    f"(was {self._failure_count})"
-                )
-                self._failure_count = 0
 
     def _on_failure(self):
         """Handle failed call"""
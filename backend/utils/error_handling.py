@@ -282,6 +282,17 @@ def aggregate_errors(results: List[Dict[str, Any]]) -> Dict[str, Any]:
     Returns:
         Aggregated result with error summary
     """
+    total = len(results)
+
+    # Common case: every tool succeeded, so skip building the split lists
+    if all(result.get("success", False) for result in results):
+        return {
+            "success": True,
+            "results": list(results),
+            "total": total,
+            "successful": total
+        }
+
     errors = []
     successes = []
 
@@ -291,19 +302,11 @@ def aggregate_errors(results: List[Dict[str, Any]]) -> Dict[str, Any]:
         else:
             errors.append(result)
 
-    if not errors:
-        return {
-            "success": True,
-            "results": successes,
-            "total": len(results),
-            "successful": len(successes)
-        }
-
     return {
         "success": False if not successes else "partial",
         "results": successes,
         "errors": errors,
-        "total": len(results),
+        "total": total,
         "successful": len(successes),
         "failed": len(errors)
     }
@@ -24,10 +24,110 @@
 import json
 import re
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Union
 
 logger = logging.getLogger(__name__)
 
+# orjson (Rust) parses several times faster than stdlib json on multi-KB LLM
+# payloads. orjson.JSONDecodeError subclasses json.JSONDecodeError, so the
+# existing except clauses keep working with either backend.
+try:
+    import orjson
+    _loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _loads = json.loads
+    ORJSON_AVAILABLE = False
+
+# Precompiled patterns for sanitize_json_string. A string literal is matched
+# atomically (escape sequences included), so in-string state is tracked by the
+# regex engine instead of a per-character Python loop. An unterminated literal
+# runs to the end of the text; a stray escape pair outside a string is kept
+# verbatim like one inside it.
+_STRING_LITERAL_RE = re.compile(r'"(?:[^"\\]|\\.)*(?:"|\\?\Z)|\\.', re.DOTALL)
+_CONTROL_CHARS_DELETE = dict.fromkeys(i for i in range(32) if chr(i) not in '\n\r\t')
+_NEWLINE_DELETE = str.maketrans('', '', '\n\r')
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+
+# Markdown code-block patterns, tried in order
+_FENCE_JSON_RE = re.compile(r'```json\s*([\s\S]*?)\s*```', re.MULTILINE)   # ```json ... ```
+_FENCE_ANY_RE = re.compile(r'```\s*([\s\S]*?)\s*```', re.MULTILINE)        # ``` ... ```
+_INLINE_CODE_RE = re.compile(r'`([\s\S]*?)`', re.MULTILINE)                 # `...` (inline code)
+
+# (pattern, literal every match must contain): a pattern whose literal is
+# absent from the text cannot match, so its scan is skipped
+_OBJECT_BLOCK_PATTERNS = (
+    (_FENCE_JSON_RE, '```json'),
+    (_FENCE_ANY_RE, '```'),
+    (_INLINE_CODE_RE, '`'),
+)
+_ARRAY_BLOCK_PATTERNS = _OBJECT_BLOCK_PATTERNS[:2]
+
+# Stdlib decoder for raw_decode, which parses exactly one JSON value and
+# ignores whatever text follows it (orjson has no equivalent)
+_DECODER = json.JSONDecoder()
+
+
+def _iter_json_candidates(text: str, block_patterns: tuple):
+    """
+    Yield values parsed from the whole text and from its code blocks.
+
+    Shared first stage of the object and array extractors. Values are
+    produced lazily, cheapest strategy first, so a caller that finds what
+    it wants stops all further scanning and parsing.
+
+    Args:
+        text: Stripped LLM response text
+        block_patterns: (pattern, literal) pairs to scan for code blocks
+    """
+    # Try direct JSON parsing first (fastest path)
+    try:
+        yield _loads(text)
+    except json.JSONDecodeError:
+        pass
+
+    # Try extracting from markdown code blocks (skip the scans if no backticks)
+    if '`' in text:
+        for pattern, literal in block_patterns:
+            if literal not in text:
+                continue
+            # finditer stops scanning as soon as a block is accepted
+            for match in pattern.finditer(text):
+                try:
+                    sanitized = sanitize_json_string(match.group(1).strip())
+                    parsed = _loads(sanitized)
+                except json.JSONDecodeError:
+                    continue
+                yield parsed
+
+
+def _iter_embedded_json(text: str, opener: str, closer: str):
+    """
+    Yield values parsed from a JSON object/array embedded in prose.
+
+    First decodes exactly one value from the first `opener` with
+    raw_decode, which ignores trailing text and needs no sanitizing for
+    well-formed JSON. Then falls back to sanitizing the span from the
+    first `opener` to the last `closer`.
+    """
+    start = text.find(opener)
+    if start == -1:
+        return
+
+    try:
+        yield _DECODER.raw_decode(text, start)[0]
+    except ValueError:
+        pass
+
+    end = text.rfind(closer)
+    if end > start:
+        try:
+            parsed = _loads(sanitize_json_string(text[start:end + 1]))
+        except json.JSONDecodeError:
+            return
+        yield parsed
+
 
 def extract_json_from_response(text: str) -> Optional[Dict[str, Any]]:
     """
@@ -36,6 +136,9 @@ def extract_json_from_response(text: str) -> Optional[Dict[str, Any]]:
     LLMs often return JSON wrapped in markdown, with extra text, or with
     formatting issues. This function handles all common cases.
 
+    Results for repeated inputs (retries, fan-out to several consumers) are
+    memoized; every call still returns a fresh, independently mutable copy.
+
     Handles:
     - Pure JSON responses
     - JSON wrapped in markdown code blocks (```json ... ```)
@@ -63,69 +166,56 @@ def extract_json_from_response(text: str) -> Optional[Dict[str, Any]]:
         >>> extract_json_from_response('Here is the result: {"key": "value"}')
         {'key': 'value'}
     """
+    if not text or len(text) > _EXTRACT_CACHE_MAX_CHARS:
+        return _extract_json_object(text)
+    return _copy_json(_extract_json_object_cached(text))
+
+
+def _extract_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """Uncached implementation of extract_json_from_response"""
     if not text:
         return None
 
     text = text.strip()
 
-    # Try direct JSON parsing first (fastest path)
-    try:
-        result = json.loads(text)
+    # Whole text, code blocks, then a JSON object embedded in prose
+    for result in _iter_json_candidates(text, _OBJECT_BLOCK_PATTERNS):
         if isinstance(result, dict):
             return result
-    except json.JSONDecodeError:
-        pass
-
-    # Try extracting from markdown code blocks
-    patterns = [
-        r'```json\s*([\s\S]*?)\s*```',   # ```json ... ```
-        r'```\s*([\s\S]*?)\s*```',        # ``` ... ```
-        r'`([\s\S]*?)`',                  # `...` (inline code)
-    ]
-
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.MULTILINE)
-        for match in matches:
-            try:
-                cleaned = match.strip() if isinstance(match, str) else match
-                sanitized = sanitize_json_string(cleaned)
-                parsed = json.loads(sanitized)
-                if isinstance(parsed, dict):
-                    return parsed
-            except json.JSONDecodeError:
-                continue
 
-    # Try to find JSON object in text
-    try:
-        start = text.find('{')
-        end = text.rfind('}')
-        if start != -1 and end != -1 and end > start:
-            json_str = text[start:end + 1]
-            sanitized = sanitize_json_string(json_str)
-            result = json.loads(sanitized)
-            if isinstance(result, dict):
-                return result
-    except json.JSONDecodeError:
-        pass
+    for result in _iter_embedded_json(text, '{', '}'):
+        if isinstance(result, dict):
+            return result
 
-    # Try to find JSON array in text
-    try:
-        start = text.find('[')
-        end = text.rfind(']')
-        if start != -1 and end != -1 and end > start:
-            json_str = text[start:end + 1]
-            sanitized = sanitize_json_string(json_str)
-            result = json.loads(sanitized)
-            # If it's an array with a dict, return the first dict
-            if isinstance(result, list) and len(result) > 0 and isinstance(result[0], dict):
-                return result[0]
-    except json.JSONDecodeError:
-        pass
+    # If there is an array with a dict, return the first dict
+    for result in _iter_embedded_json(text, '[', ']'):
+        if isinstance(result, list) and len(result) > 0 and isinstance(result[0], dict):
+            return result[0]
 
     logger.warning(f"Failed to extract JSON from response: {text[:200]}...")
     return None
 
 
+# Bounded memo for extract_json_from_response; very long texts bypass it so
+# keys stay small
+_EXTRACT_CACHE_MAX_CHARS = 16384
+_extract_json_object_cached = lru_cache(maxsize=256)(_extract_json_object)
+
+
+def _copy_json(value: Any) -> Any:
+    """
+    Copy a parsed JSON value so callers can mutate it without touching the
+    cached original. Only dicts and lists are mutable in decoded JSON, so
+    this is much cheaper than copy.deepcopy.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return {key: _copy_json(item) for key, item in value.items()}
+    if value_type is list:
+        return [_copy_json(item) for item in value]
+    return value
+
+
 def extract_json_array_from_response(text: str) -> Optional[List[Any]]:
     """
     Extract JSON array from LLM response.
@@ -143,44 +233,14 @@ def extract_json_array_from_response(text: str) -> Optional[List[Any]]:
 
     text = text.strip()
 
-    # Try direct JSON parsing first
-    try:
-        result = json.loads(text)
+    # Same strategies as extract_json_from_response, minus inline code
+    for result in _iter_json_candidates(text, _ARRAY_BLOCK_PATTERNS):
         if isinstance(result, list):
             return result
-    except json.JSONDecodeError:
-        pass
-
-    # Try extracting from markdown code blocks
-    patterns = [
-        r'```json\s*([\s\S]*?)\s*```',
-        r'```\s*([\s\S]*?)\s*```',
-    ]
-
-    for pattern in patterns:
-        matches = re.findall(pattern, text, re.MULTILINE)
-        for match in matches:
-            try:
-                cleaned = match.strip()
-                sanitized = sanitize_json_string(cleaned)
-                parsed = json.loads(sanitized)
-                if isinstance(parsed, list):
-                    return parsed
-            except json.JSONDecodeError:
-                continue
 
-    # Try to find JSON array in text
-    try:
-        start = text.find('[')
-        end = text.rfind(']')
-        if start != -1 and end != -1 and end > start:
-            json_str = text[start:end + 1]
-            sanitized = sanitize_json_string(json_str)
-            result = json.loads(sanitized)
-            if isinstance(result, list):
-                return result
-    except json.JSONDecodeError:
-        pass
+    for result in _iter_embedded_json(text, '[', ']'):
+        if isinstance(result, list):
+            return result
 
     logger.warning(f"Failed to extract JSON array from response: {text[:200]}...")
     return None
@@ -212,41 +272,25 @@ def sanitize_json_string(text: str) -> str:
         return text
 
     # Remove invalid control characters (except whitespace)
-    text = ''.join(ch for ch in text if ord(ch) >= 32 or ch in '\n\r\t')
-
-    # Handle literal newlines/carriage returns outside of string values
-    result = []
-    in_string = False
-    escape_next = False
-
-    for i, char in enumerate(text):
-        if escape_next:
-            result.append(char)
-            escape_next = False
-            continue
-
-        if char == '\\':
-            result.append(char)
-            escape_next = True
-            continue
-
-        if char == '"' and (i == 0 or text[i-1] != '\\'):
-            in_string = not in_string
-            result.append(char)
-        elif char == '\n' and not in_string:
-            # Literal newline outside string - skip it
-            continue
-        elif char == '\r' and not in_string:
-            # Literal carriage return outside string - skip it
-            continue
-        else:
-            result.append(char)
-
-    text = ''.join(result)
+    text = text.translate(_CONTROL_CHARS_DELETE)
+
+    # Drop literal newlines/carriage returns outside of string values,
+    # keeping string literals untouched. Single-line input (compact JSON)
+    # skips the tokenizing pass entirely.
+    if '\n' in text or '\r' in text:
+        parts = []
+        pos = 0
+        for match in _STRING_LITERAL_RE.finditer(text):
+            parts.append(text[pos:match.start()].translate(_NEWLINE_DELETE))
+            parts.append(match.group())
+            pos = match.end()
+        parts.append(text[pos:].translate(_NEWLINE_DELETE))
+
+        text = ''.join(parts)
 
     # Remove trailing commas before } or ]
-    text = re.sub(r',\s*}', '}', text)
-    text = re.sub(r',\s*]', ']', text)
+    if ',' in text:
+        text = _TRAILING_COMMA_RE.sub(r'\1', text)
 
     return text
 
@@ -269,7 +313,7 @@ def safe_json_loads(text: str, default: Any = None) -> Any:
         {}
     """
     try:
-        return json.loads(text)
+        return _loads(text)
     except (json.JSONDecodeError, TypeError):
         return default
 
@@ -341,6 +385,11 @@ def ensure_string(value: Any, default: str = "") -> str:
     Returns:
         String representation
     """
+    # Exact-type check first: a pointer compare, no MRO walk for the
+    # common already-a-string case
+    if type(value) is str:
+        return value if value else default
+
     if value is None:
         return default
 
@@ -370,10 +419,13 @@ def ensure_float(value: Any, default: float = 0.0, min_val: float = None, max_va
     Returns:
         Float value
     """
-    try:
-        result = float(value)
-    except (ValueError, TypeError):
-        result = default
+    if type(value) is float:
+        result = value
+    else:
+        try:
+            result = float(value)
+        except (ValueError, TypeError):
+            result = default
 
     if min_val is not None:
         result = max(min_val, result)
@@ -394,6 +446,9 @@ def ensure_list(value: Any, default: List = None) -> List:
     Returns:
         List value
     """
+    if type(value) is list:
+        return value
+
     if default is None:
         default = []
 
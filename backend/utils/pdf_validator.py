@@ -2,14 +2,21 @@
 PDF Validation Utility
 Validates PDF files before processing to ensure quality and prevent errors
 """
+import functools
 import logging
 import os
 import io
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# Fixed schema for per-error-type counters (index into PDFValidator._error_counts)
+_ERROR_KINDS = ('file_too_small', 'file_too_large', 'missing_signature')
+_ERROR_IDX = {name: i for i, name in enumerate(_ERROR_KINDS)}
+
 
 class PDFValidationError(Exception):
     """Exception raised when PDF validation fails"""
@@ -31,15 +38,27 @@ class PDFValidator:
     MIN_FILE_SIZE = 1024  # 1 KB
     MAX_FILE_SIZE = 50 * 1024 * 1024  # 50 MB
     VALID_EXTENSIONS = {'.pdf'}
+    _VALID_EXT_TUPLE = tuple(VALID_EXTENSIONS)  # str.endswith accepts a tuple
     PDF_SIGNATURE = b'%PDF-'
+    CONTENT_SCAN_WINDOW = 64 * 1024  # Bytes scanned at each end for PDF objects
+    BATCH_MAX_WORKERS = 8  # Threads used for file batch validation
 
     def __init__(self):
         """Initialize PDF validator"""
-        self.validation_stats = {
-            "total_validated": 0,
-            "passed": 0,
-            "failed": 0,
-            "errors": {}
+        self.reset_stats()
+
+    @property
+    def validation_stats(self) -> Dict[str, Any]:
+        """Validation counters as a dictionary (built on demand)"""
+        return {
+            "total_validated": self._total,
+            "passed": self._passed,
+            "failed": self._failed,
+            "errors": {
+                name: count
+                for name, count in zip(_ERROR_KINDS, self._error_counts)
+                if count
+            }
         }
 
     def validate_pdf_bytes(
@@ -62,32 +81,63 @@ class PDFValidator:
         Raises:
             PDFValidationError: If strict=True and validation fails
         """
-        self.validation_stats["total_validated"] += 1
+        size = len(pdf_bytes)
+        window = self.CONTENT_SCAN_WINDOW
+        if size > 2 * window:
+            head = pdf_bytes[:window]
+            tail = pdf_bytes[-window:]
+        else:
+            head, tail = pdf_bytes, b''
+
+        return self._validate_core(head, tail, size, filename, strict)
+
+    def _validate_core(
+        self,
+        head: bytes,
+        tail: bytes,
+        size: int,
+        filename: Optional[str],
+        strict: bool
+    ) -> Dict[str, Any]:
+        """
+        Run the validation checks on a bounded view of a PDF
+
+        Args:
+            head: Leading bytes of the file (at least CONTENT_SCAN_WINDOW if available)
+            tail: Trailing CONTENT_SCAN_WINDOW bytes, or b'' if head holds the whole file
+            size: Total file size in bytes
+            filename: Optional filename for better error messages
+            strict: If True, raise exception on validation failure
+
+        Returns:
+            Validation result dictionary with status and details
+        """
+        self._total += 1
         result = {
             "valid": False,
             "filename": filename or "unknown",
-            "size_bytes": len(pdf_bytes),
+            "size_bytes": size,
             "errors": [],
             "warnings": []
         }
 
         # Check 1: File size
-        if len(pdf_bytes) < self.MIN_FILE_SIZE:
-            error = f"File too small ({len(pdf_bytes)} bytes, min: {self.MIN_FILE_SIZE})"
+        if size < self.MIN_FILE_SIZE:
+            error = f"File too small ({size} bytes, min: {self.MIN_FILE_SIZE})"
             result["errors"].append(error)
             logger.warning(f"[PDF_VALIDATOR] {error} - {filename}")
             self._track_error("file_too_small")
 
-        elif len(pdf_bytes) > self.MAX_FILE_SIZE:
-            error = f"File too large ({len(pdf_bytes)} bytes, max: {self.MAX_FILE_SIZE})"
+        elif size > self.MAX_FILE_SIZE:
+            error = f"File too large ({size} bytes, max: {self.MAX_FILE_SIZE})"
             result["errors"].append(error)
             logger.warning(f"[PDF_VALIDATOR] {error} - {filename}")
             self._track_error("file_too_large")
 
         # Check 2: PDF signature
-        if not pdf_bytes.startswith(self.PDF_SIGNATURE):
+        if not head.startswith(self.PDF_SIGNATURE):
             # Check if signature exists anywhere in first 1024 bytes (some PDFs have leading whitespace)
-            if self.PDF_SIGNATURE not in pdf_bytes[:1024]:
+            if self.PDF_SIGNATURE not in head[:1024]:
                 error = "Missing PDF signature (%PDF- header)"
                 result["errors"].append(error)
                 logger.warning(f"[PDF_VALIDATOR] {error} - {filename}")
@@ -105,20 +155,25 @@ class PDFValidator:
 
         # Check 4: Basic content validation
         try:
-            # Try to find common PDF objects
-            if b'/Type' not in pdf_bytes and b'/Page' not in pdf_bytes:
+            # Try to find common PDF objects. Object dictionaries and the
+            # trailer sit near the ends of the file, so only those windows
+            # are scanned instead of the whole (up to 50 MB) buffer.
+            # Each window is searched in place rather than concatenated,
+            # which saves a copy and cannot match across the seam.
+            if not (b'/Type' in head or b'/Page' in head
+                    or b'/Type' in tail or b'/Page' in tail):
                 result["warnings"].append("No PDF objects detected (may be empty or corrupted)")
         except Exception as e:
             result["warnings"].append(f"Content validation error: {str(e)}")
 
         # Determine if valid
-        result["valid"] = len(result["errors"]) == 0
+        valid = result["valid"] = not result["errors"]
 
-        if result["valid"]:
-            self.validation_stats["passed"] += 1
-            logger.debug(f"[PDF_VALIDATOR] ✓ Valid PDF - {filename} ({len(pdf_bytes)} bytes)")
+        if valid:
+            self._passed += 1
+            logger.debug("[PDF_VALIDATOR] ✓ Valid PDF - %s (%d bytes)", filename, size)
         else:
-            self.validation_stats["failed"] += 1
+            self._failed += 1
             logger.warning(f"[PDF_VALIDATOR] ✗ Invalid PDF - {filename}: {', '.join(result['errors'])}")
 
             if strict:
@@ -153,9 +208,18 @@ class PDFValidator:
         filename = os.path.basename(file_path)
 
         try:
+            # Read only the head and tail windows the checks need, never the
+            # whole file; the size comes from the filesystem
+            size = os.path.getsize(file_path)
+            window = self.CONTENT_SCAN_WINDOW
             with open(file_path, 'rb') as f:
-                pdf_bytes = f.read()
-            return self.validate_pdf_bytes(pdf_bytes, filename=filename, strict=strict)
+                if size > 2 * window:
+                    head = f.read(window)
+                    f.seek(-window, os.SEEK_END)
+                    tail = f.read(window)
+                else:
+                    head, tail = f.read(), b''
+            return self._validate_core(head, tail, size, filename, strict)
 
         except Exception as e:
             logger.error(f"[PDF_VALIDATOR] Error reading PDF file {file_path}: {e}")
@@ -186,16 +250,22 @@ class PDFValidator:
         }
 
         try:
-            parsed = urlparse(url)
+            split = _split_http_url(url) if isinstance(url, str) else None
+            if split is not None:
+                # Fast path: plain http(s) URL, no ParseResult needed
+                scheme, path = split
+            else:
+                parsed = urlparse(url)
+                scheme, path = parsed.scheme, parsed.path
 
             # Check scheme
-            if parsed.scheme not in ['http', 'https']:
-                result["errors"].append(f"Invalid URL scheme: {parsed.scheme}")
+            if scheme not in ['http', 'https']:
+                result["errors"].append(f"Invalid URL scheme: {scheme}")
                 result["valid"] = False
 
             # Check path extension
-            path_lower = parsed.path.lower()
-            if not any(path_lower.endswith(ext) for ext in self.VALID_EXTENSIONS):
+            path_lower = path.lower()
+            if not path_lower.endswith(self._VALID_EXT_TUPLE):
                 result["warnings"].append(f"URL doesn't end with .pdf extension")
 
             # Check URL length (some URLs are too long and likely broken)
@@ -211,14 +281,20 @@ class PDFValidator:
     def batch_validate(
         self,
         pdf_list: list,
-        validation_type: str = 'bytes'
+        validation_type: str = 'bytes',
+        max_workers: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Validate multiple PDFs and return summary
 
+        File batches are validated on a thread pool so the disk reads
+        overlap; bytes and URL checks are cheap in-memory work and stay
+        sequential.
+
         Args:
             pdf_list: List of PDFs (bytes, file paths, or URLs depending on validation_type)
             validation_type: Type of validation ('bytes', 'file', or 'url')
+            max_workers: Thread count for file batches (default: BATCH_MAX_WORKERS)
 
         Returns:
             Summary dictionary with results for each PDF
@@ -230,30 +306,23 @@ class PDFValidator:
             "items": []
         }
 
-        for i, pdf_item in enumerate(pdf_list):
-            try:
-                if validation_type == 'bytes':
-                    result = self.validate_pdf_bytes(pdf_item, filename=f"pdf_{i}")
-                elif validation_type == 'file':
-                    result = self.validate_pdf_file(pdf_item)
-                elif validation_type == 'url':
-                    result = self.validate_pdf_url(pdf_item)
-                else:
-                    result = {"valid": False, "errors": [f"Unknown validation type: {validation_type}"]}
-
-                results["items"].append(result)
+        if validation_type == 'file' and len(pdf_list) > 1:
+            workers = min(max_workers or self.BATCH_MAX_WORKERS, len(pdf_list))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # Each worker counts into its own validator; merged here so
+                # the shared stats dict is only touched by this thread
+                isolated = functools.partial(_validate_file_isolated, type(self))
+                for result, worker in executor.map(isolated, enumerate(pdf_list)):
+                    results["items"].append(result)
+                    self._merge_stats(worker)
+        else:
+            for i, pdf_item in enumerate(pdf_list):
+                results["items"].append(self._validate_item(i, pdf_item, validation_type))
 
-                if result["valid"]:
-                    results["valid"] += 1
-                else:
-                    results["invalid"] += 1
-
-            except Exception as e:
-                logger.error(f"[PDF_VALIDATOR] Error validating PDF {i}: {e}")
-                results["items"].append({
-                    "valid": False,
-                    "errors": [f"Validation exception: {str(e)}"]
-                })
+        for result in results["items"]:
+            if result["valid"]:
+                results["valid"] += 1
+            else:
                 results["invalid"] += 1
 
         logger.info(
@@ -264,11 +333,37 @@ class PDFValidator:
 
         return results
 
+    def _validate_item(self, i: int, pdf_item: Any, validation_type: str) -> Dict[str, Any]:
+        """Validate one batch item, turning exceptions into an invalid result"""
+        try:
+            if validation_type == 'bytes':
+                return self.validate_pdf_bytes(pdf_item, filename=f"pdf_{i}")
+            elif validation_type == 'file':
+                return self.validate_pdf_file(pdf_item)
+            elif validation_type == 'url':
+                return self.validate_pdf_url(pdf_item)
+            else:
+                return {"valid": False, "errors": [f"Unknown validation type: {validation_type}"]}
+
+        except Exception as e:
+            logger.error(f"[PDF_VALIDATOR] Error validating PDF {i}: {e}")
+            return {
+                "valid": False,
+                "errors": [f"Validation exception: {str(e)}"]
+            }
+
+    def _merge_stats(self, other: "PDFValidator"):
+        """Add another validator's statistics into this one"""
+        self._total += other._total
+        self._passed += other._passed
+        self._failed += other._failed
+        counts = self._error_counts
+        for i, count in enumerate(other._error_counts):
+            counts[i] += count
+
     def _track_error(self, error_type: str):
         """Track error type in statistics"""
-        if error_type not in self.validation_stats["errors"]:
-            self.validation_stats["errors"][error_type] = 0
-        self.validation_stats["errors"][error_type] += 1
+        self._error_counts[_ERROR_IDX[error_type]] += 1
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -278,8 +373,8 @@ class PDFValidator:
             Dictionary with validation stats
         """
         pass_rate = (
-            self.validation_stats["passed"] / self.validation_stats["total_validated"] * 100
-            if self.validation_stats["total_validated"] > 0
+            self._passed / self._total * 100
+            if self._total > 0
             else 0
         )
 
@@ -290,12 +385,61 @@ class PDFValidator:
 
     def reset_stats(self):
         """Reset validation statistics"""
-        self.validation_stats = {
-            "total_validated": 0,
-            "passed": 0,
-            "failed": 0,
-            "errors": {}
-        }
+        self._total = 0
+        self._passed = 0
+        self._failed = 0
+        self._error_counts = array('Q', [0] * len(_ERROR_KINDS))
+
+
+# Characters that make urlparse do more than a plain split (IPv6 host
+# brackets and their validation, path params, stripped whitespace); URLs
+# containing them take the slow path
+_URL_SLOW_PATH_CHARS = '[];\t\r\n'
+
+
+def _split_http_url(url: str) -> Optional[tuple]:
+    """
+    Split a plain http(s) URL into (scheme, path) without urlparse
+
+    Returns:
+        (scheme, path) matching urlparse for simple http/https URLs, or
+        None if the URL needs full parsing
+    """
+    scheme, sep, rest = url.partition('://')
+    if not sep:
+        return None
+    scheme = scheme.lower()
+    if scheme != 'http' and scheme != 'https':
+        return None
+    for char in _URL_SLOW_PATH_CHARS:
+        if char in rest:
+            return None
+
+    # Fragment, then query, then the netloc before the first '/'
+    rest = rest.partition('#')[0].partition('?')[0]
+    netloc, slash, path = rest.partition('/')
+    if not netloc.isascii():
+        # urlparse runs an NFKC check on non-ASCII hosts
+        return None
+    return scheme, slash + path
+
+
+def _validate_file_isolated(validator_cls: type, indexed_path: tuple) -> tuple:
+    """
+    Validate one file with a private validator (batch worker)
+
+    Args:
+        validator_cls: Class of the batch's validator, so subclass
+            overrides apply on this path too
+        indexed_path: (index, file path)
+
+    Returns:
+        Tuple of (validation result, the worker's validator)
+    """
+    i, file_path = indexed_path
+    validator = validator_cls()
+    result = validator._validate_item(i, file_path, 'file')
+    return result, validator
 
 
 # Singleton instance
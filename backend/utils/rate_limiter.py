@@ -16,14 +16,77 @@ import time
 import threading
 import logging
 from typing import Dict, Optional, Callable, Any
-from datetime import datetime, timedelta
+from datetime import datetime
 from collections import deque
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+class _SlidingWindowCounter:
+    """
+    Sliding-window request counter over a fixed ring of time buckets.
+
+    The window is split into `num_buckets` buckets of `bucket_seconds` each.
+    Advancing the clock zeroes only the buckets that rolled out, and the
+    running total is kept incrementally, so counting and recording are O(1)
+    with constant memory regardless of the request rate. A request stops
+    counting once its bucket leaves the window, i.e. up to one bucket width
+    earlier than an exact per-request window would release it.
+
+    Not thread-safe; callers hold the owning limiter's lock.
+    """
+
+    def __init__(self, bucket_seconds: float, num_buckets: int):
+        self.bucket_seconds = bucket_seconds
+        self.num_buckets = num_buckets
+        self._counts = [0] * num_buckets
+        self._tick = int(time.monotonic() // bucket_seconds)
+        self.total = 0
+
+    def advance(self, now: float):
+        """Roll the window forward to monotonic time `now`"""
+        tick = int(now // self.bucket_seconds)
+        steps = tick - self._tick
+        if steps <= 0:
+            return
+
+        counts = self._counts
+        if steps >= self.num_buckets:
+            for i in range(self.num_buckets):
+                counts[i] = 0
+            self.total = 0
+        else:
+            for t in range(self._tick + 1, tick + 1):
+                i = t % self.num_buckets
+                self.total -= counts[i]
+                counts[i] = 0
+        self._tick = tick
+
+    def add(self, n: int = 1):
+        """Record `n` requests in the current bucket"""
+        self._counts[self._tick % self.num_buckets] += n
+        self.total += n
+
+    def seconds_until_release(self, now: float) -> float:
+        """Seconds until the oldest recorded request leaves the window"""
+        if not self.total:
+            return 0.0
+        counts = self._counts
+        for age in range(self.num_buckets - 1, -1, -1):
+            tick = self._tick - age
+            if counts[tick % self.num_buckets]:
+                return max(0.0, (tick + self.num_buckets) * self.bucket_seconds - now)
+        return 0.0
+
+    def clear(self):
+        """Forget all recorded requests"""
+        for i in range(self.num_buckets):
+            self._counts[i] = 0
+        self.total = 0
+
+
+@dataclass(slots=True)
 class APIQuotaInfo:
     """Information about API quota limits and usage"""
     api_name: str
@@ -33,8 +96,6 @@ class APIQuotaInfo:
     current_minute_count: int = 0
     current_day_count: int = 0
     current_tokens: int = 0
-    minute_reset_time: datetime = field(default_factory=datetime.now)
-    day_reset_time: datetime = field(default_factory=datetime.now)
     total_requests: int = 0
     total_quota_errors: int = 0
     last_quota_error: Optional[datetime] = None
@@ -59,8 +120,15 @@ class RateLimiter:
             make_api_call()
         else:
             print("Rate limit exceeded, try later")
+
+        # Reserve slots for a whole batch in one call
+        limiter.acquire_n(len(texts))
+        embed_batch(texts)
     """
 
+    # Lower bound on a single acquire() wait, in seconds
+    _MIN_WAIT = 0.005
+
     def __init__(
         self,
         requests_per_minute: int = 60,
@@ -82,17 +150,26 @@ class RateLimiter:
         self.requests_per_hour = requests_per_hour
         self.requests_per_day = requests_per_day
 
-        # Sliding window tracking
-        self.minute_window = deque(maxlen=requests_per_minute)
-        self.hour_window = deque() if requests_per_hour else None
-        self.day_window = deque() if requests_per_day else None
+        # Sliding window tracking (1 s buckets per minute, 1 min buckets per
+        # hour, 1 h buckets per day)
+        self._minute_window = _SlidingWindowCounter(1, 60)
+        self._hour_window = _SlidingWindowCounter(60, 60) if requests_per_hour else None
+        self._day_window = _SlidingWindowCounter(3600, 24) if requests_per_day else None
+
+        # Whole monotonic second the windows were last rolled to. Every
+        # bucket width is a multiple of one second, so within the same second
+        # there is nothing to roll.
+        self._last_clean_tick = -1
 
         # Statistics
         self.total_requests = 0
         self.total_blocked = 0
 
-        # Thread safety
-        self._lock = threading.RLock()
+        # Thread safety. A plain Lock (cheaper than RLock): no method takes
+        # it while already holding it; locked helpers use a _locked suffix.
+        self._lock = threading.Lock()
+        # Blocked acquire() callers sleep on this until the next slot frees
+        self._cond = threading.Condition(self._lock)
 
         logger.info(
             f"[RATE_LIMITER:{name}] Initialized - "
@@ -102,22 +179,20 @@ class RateLimiter:
         )
 
     def _clean_old_requests(self):
-        """Remove requests outside the time windows"""
-        now = time.time()
+        """Roll expired buckets out of the time windows"""
+        now = time.monotonic()
+        tick = int(now)
+        if tick == self._last_clean_tick:
+            return now
+        self._last_clean_tick = tick
 
-        # Clean minute window (keep last 60 seconds)
-        while self.minute_window and now - self.minute_window[0] > 60:
-            self.minute_window.popleft()
+        self._minute_window.advance(now)
+        if self._hour_window is not None:
+            self._hour_window.advance(now)
+        if self._day_window is not None:
+            self._day_window.advance(now)
 
-        # Clean hour window (keep last 3600 seconds)
-        if self.hour_window:
-            while self.hour_window and now - self.hour_window[0] > 3600:
-                self.hour_window.popleft()
-
-        # Clean day window (keep last 86400 seconds)
-        if self.day_window:
-            while self.day_window and now - self.day_window[0] > 86400:
-                self.day_window.popleft()
+        return now
 
     def try_acquire(self) -> bool:
         """
@@ -128,32 +203,60 @@ class RateLimiter:
         """
         with self._lock:
             self._clean_old_requests()
+            return self._try_acquire_locked(1)
+
+    def try_acquire_n(self, n: int) -> bool:
+        """
+        Try to acquire `n` slots at once without blocking.
+
+        All n slots are reserved atomically across every window, so a batch
+        (e.g. 100 embeddings) costs one lock round-trip instead of n.
+
+        Args:
+            n: Number of slots to reserve
 
-            # Check all limits
-            if len(self.minute_window) >= self.requests_per_minute:
+        Returns:
+            True if all n slots were reserved, False if that would exceed a limit
+        """
+        self._check_batch_size(n)
+        with self._lock:
+            self._clean_old_requests()
+            return self._try_acquire_locked(n)
+
+    def _check_batch_size(self, n: int):
+        """Reject batch sizes that no window could ever admit"""
+        if n < 1:
+            raise ValueError(f"n must be >= 1, got {n}")
+        for limit in (self.requests_per_minute, self.requests_per_hour, self.requests_per_day):
+            if limit and n > limit:
+                raise ValueError(f"n={n} exceeds rate limit of {limit} for '{self.name}'")
+
+    def _try_acquire_locked(self, n: int) -> bool:
+        """try_acquire body; caller holds the lock and has cleaned the windows"""
+        # Check all limits
+        if self._minute_window.total + n > self.requests_per_minute:
+            self.total_blocked += 1
+            return False
+
+        if self._hour_window is not None:
+            if self._hour_window.total + n > self.requests_per_hour:
                 self.total_blocked += 1
                 return False
 
-            if self.hour_window and self.requests_per_hour:
-                if len(self.hour_window) >= self.requests_per_hour:
-                    self.total_blocked += 1
-                    return False
-
-            if self.day_window and self.requests_per_day:
-                if len(self.day_window) >= self.requests_per_day:
-                    self.total_blocked += 1
-                    return False
+        if self._day_window is not None:
+            if self._day_window.total + n > self.requests_per_day:
+                self.total_blocked += 1
+                return False
 
-            # Record request
-            now = time.time()
-            self.minute_window.append(now)
-            if self.hour_window is not None:
-                self.hour_window.append(now)
-            if self.day_window is not None:
-                self.day_window.append(now)
+        # Record request(s)
+        self._minute_window.add(n)
+        if self._hour_window is not None:
+            self._hour_window.add(n)
+        if self._day_window is not None:
+            self._day_window.add(n)
 
-            self.total_requests += 1
-            return True
+        self.total_requests += n
+        return True
 
     def acquire(self, timeout: Optional[float] = None) -> bool:
         """
@@ -165,72 +268,192 @@ class RateLimiter:
         Returns:
             True if acquired, False if timeout reached
         """
-        start_time = time.time()
+        return self._acquire(1, timeout)
+
+    def acquire_n(self, n: int, timeout: Optional[float] = None) -> bool:
+        """
+        Acquire `n` slots at once, blocking until available or timeout.
+
+        Args:
+            n: Number of slots to reserve
+            timeout: Maximum seconds to wait (None = wait forever)
+
+        Returns:
+            True if acquired, False if timeout reached
+        """
+        self._check_batch_size(n)
+        return self._acquire(n, timeout)
+
+    def _acquire(self, n: int, timeout: Optional[float]) -> bool:
+        """Shared wait loop of acquire() and acquire_n()"""
+        deadline = None if timeout is None else time.monotonic() + timeout
         wait_logged = False
 
-        while True:
-            if self.try_acquire():
-                return True
+        with self._cond:
+            while True:
+                now = self._clean_old_requests()
+                if self._try_acquire_locked(n):
+                    return True
 
-            # Check timeout
-            if timeout is not None and (time.time() - start_time) >= timeout:
-                logger.warning(f"[RATE_LIMITER:{self.name}] Timeout after {timeout}s")
-                return False
+                # Check timeout
+                remaining = None if deadline is None else deadline - now
+                if remaining is not None and remaining <= 0:
+                    logger.warning(f"[RATE_LIMITER:{self.name}] Timeout after {timeout}s")
+                    return False
+
+                wait_time = self._time_until_available_locked(now, n)
 
-            # Log only once that we're waiting
-            if not wait_logged:
-                wait_time = self._time_until_available()
-                logger.debug(
-                    f"[RATE_LIMITER:{self.name}] Rate limit reached, "
-                    f"waiting ~{wait_time:.1f}s"
-                )
-                wait_logged = True
+                # Log only once that we're waiting
+                if not wait_logged:
+                    logger.debug(
+                        "[RATE_LIMITER:%s] Rate limit reached, waiting ~%.1fs",
+                        self.name, wait_time
+                    )
+                    wait_logged = True
 
-            # Wait a short time before retrying
-            time.sleep(0.1)
+                # Sleep until the oldest blocking bucket expires (or reset()
+                # wakes us); the floor guards against float rounding spins
+                wait_time = max(wait_time, self._MIN_WAIT)
+                if remaining is not None and remaining < wait_time:
+                    wait_time = remaining
+                self._cond.wait(wait_time)
 
     def _time_until_available(self) -> float:
         """Calculate seconds until a slot becomes available"""
         with self._lock:
-            self._clean_old_requests()
-
-            if len(self.minute_window) < self.requests_per_minute:
-                return 0.0
+            return self._time_until_available_locked(self._clean_old_requests())
 
+    def _time_until_available_locked(self, now: float, n: int = 1) -> float:
+        """
+        Seconds until the oldest request blocking `n` more slots expires;
+        caller holds the lock and cleaned at `now`
+        """
+        wait = 0.0
+        if self._minute_window.total + n > self.requests_per_minute:
             # Time until oldest request in minute window expires
-            oldest = self.minute_window[0]
-            wait_time = 60 - (time.time() - oldest)
-            return max(0.0, wait_time)
+            wait = self._minute_window.seconds_until_release(now)
+        if self._hour_window is not None and self._hour_window.total + n > self.requests_per_hour:
+            wait = max(wait, self._hour_window.seconds_until_release(now))
+        if self._day_window is not None and self._day_window.total + n > self.requests_per_day:
+            wait = max(wait, self._day_window.seconds_until_release(now))
+        return wait
 
     def get_stats(self) -> Dict[str, Any]:
         """Get rate limiter statistics"""
         with self._lock:
-            self._clean_old_requests()
+            return self._stats_snapshot(self._clean_old_requests())
 
-            return {
-                "name": self.name,
-                "requests_per_minute": self.requests_per_minute,
-                "current_minute_count": len(self.minute_window),
-                "current_hour_count": len(self.hour_window) if self.hour_window else 0,
-                "current_day_count": len(self.day_window) if self.day_window else 0,
-                "total_requests": self.total_requests,
-                "total_blocked": self.total_blocked,
-                "time_until_available": self._time_until_available()
-            }
+    def get_stats_lockfree(self) -> Dict[str, Any]:
+        """
+        Get rate limiter statistics without ever waiting on the lock.
+
+        Exact when the lock is free. Otherwise the counters are read as of
+        the last admission call's window roll (slightly stale), which is
+        fine for dashboards and keeps polling off the admission path.
+        """
+        if self._lock.acquire(blocking=False):
+            try:
+                return self._stats_snapshot(self._clean_old_requests())
+            finally:
+                self._lock.release()
+        return self._stats_snapshot(time.monotonic())
+
+    def _stats_snapshot(self, now: float) -> Dict[str, Any]:
+        """Build the get_stats dict from the current counters"""
+        return {
+            "name": self.name,
+            "requests_per_minute": self.requests_per_minute,
+            "current_minute_count": self._minute_window.total,
+            "current_hour_count": self._hour_window.total if self._hour_window is not None else 0,
+            "current_day_count": self._day_window.total if self._day_window is not None else 0,
+            "total_requests": self.total_requests,
+            "total_blocked": self.total_blocked,
+            "time_until_available": self._time_until_available_locked(now)
+        }
 
     def reset(self):
         """Reset rate limiter (for testing)"""
         with self._lock:
-            self.minute_window.clear()
-            if self.hour_window:
-                self.hour_window.clear()
-            if self.day_window:
-                self.day_window.clear()
+            self._minute_window.clear()
+            if self._hour_window is not None:
+                self._hour_window.clear()
+            if self._day_window is not None:
+                self._day_window.clear()
             self.total_requests = 0
             self.total_blocked = 0
+            self._cond.notify_all()
             logger.info(f"[RATE_LIMITER:{self.name}] Reset")
 
 
+# Static body of APIQuotaTracker.get_quota_recommendations; only the named
+# fields vary between calls
+_QUOTA_RECOMMENDATIONS_TEMPLATE = """
+## API Quota Recommendations for {api_name}
+
+### Current Status
+- Total Requests: {total_requests}
+- Total Quota Errors: {total_quota_errors}
+- Daily Limit: {daily_limit}
+- Daily Usage: {daily_usage}
+
+### Error Rate
+- Recent Errors (last 100): {recent_error_count}
+- Last Error: {last_error}
+
+### Recommendations
+
+#### 1. Increase API Quota (Google Cloud Console)
+
+**For Google Gemini API:**
+1. Go to [Google Cloud Console](https://console.cloud.google.com/)
+2. Select your project
+3. Navigate to: **APIs & Services** → **Gemini API**
+4. Click **Quotas** tab
+5. Request quota increase:
+   - Current: {current_quota}
+   - Recommended: 10,000+ requests per day
+
+**Pricing Tiers:**
+- **Free Tier**: 1,500 requests/day, 60 requests/minute
+- **Paid Tier**: Up to 1,000,000+ requests/day
+- **Enterprise**: Custom limits available
+
+#### 2. Enable Billing
+
+If not already enabled:
+1. Go to **Billing** → **Link a billing account**
+2. Add payment method
+3. Quota limits increase automatically
+
+#### 3. Optimization Strategies
+
+While waiting for quota increase:
+- **Use Circuit Breaker**: Already enabled (fails fast after 5 errors)
+- **Batch Requests**: Combine multiple operations when possible
+- **Cache Results**: Cache frequently used responses
+- **Retry Strategy**: Use exponential backoff (already implemented)
+- **Off-Peak Usage**: Schedule heavy operations during low-traffic hours
+
+#### 4. Alternative Solutions
+
+If quota cannot be increased:
+- **OpenAI Fallback**: Already configured (automatic fallback)
+- **Load Distribution**: Spread load across multiple API keys
+- **Queue System**: Implement request queuing during peak times
+
+### Contact Information
+
+**Google Cloud Support:**
+- Enterprise customers: [Contact Support](https://cloud.google.com/support)
+- Community: [Google Cloud Community](https://www.googlecloudcommunity.com/)
+
+**Estimated Time to Resolution:**
+- Billing enablement: Immediate
+- Quota increase request: 1-2 business days
+- Enterprise custom quotas: 3-5 business days
+"""
+
+
 class APIQuotaTracker:
     """
     Track API quota usage and detect quota exhaustion.
@@ -250,6 +473,13 @@ class APIQuotaTracker:
                 print(tracker.get_quota_recommendations())
     """
 
+    # Quota is considered exhausted after this many errors within the window
+    EXHAUSTION_ERROR_COUNT = 5
+    EXHAUSTION_ERROR_WINDOW = 60  # seconds
+
+    # Error messages kept in recent_errors are truncated to this length
+    ERROR_MESSAGE_MAX_CHARS = 128
+
     def __init__(
         self,
         api_name: str,
@@ -273,11 +503,25 @@ class APIQuotaTracker:
             tokens_per_minute=tokens_per_minute
         )
 
-        # Error tracking
+        # Index of the monotonic minute/day the current counts belong to
+        now = time.monotonic()
+        self._minute_bucket_idx = int(now // 60)
+        self._day_bucket_idx = int(now // 86400)
+
+        # Error tracking: truncated messages of the last 100 quota errors
+        # (full provider payloads can run to kilobytes each)
         self.recent_errors = deque(maxlen=100)
 
-        # Thread safety
-        self._lock = threading.RLock()
+        # Monotonic times of the last few quota errors; the quota counts as
+        # exhausted when the oldest of a full deque is still inside the window
+        self._quota_error_times = deque(maxlen=self.EXHAUSTION_ERROR_COUNT)
+
+        # (fields, text) of the last rendered quota recommendations
+        self._recommendations_cache = None
+
+        # Thread safety. get_stats no longer re-enters is_quota_exhausted,
+        # so a plain Lock suffices
+        self._lock = threading.Lock()
 
         logger.info(
             f"[QUOTA_TRACKER:{api_name}] Initialized - "
@@ -293,34 +537,37 @@ class APIQuotaTracker:
     def record_quota_error(self, error_message: str):
         """Record a quota/rate limit error"""
         with self._lock:
+            now = time.monotonic()
             self.quota_info.total_quota_errors += 1
             self.quota_info.last_quota_error = datetime.now()
-            self.recent_errors.append({
-                "timestamp": datetime.now(),
-                "message": error_message
-            })
+            self.recent_errors.append(error_message[:self.ERROR_MESSAGE_MAX_CHARS])
+            self._quota_error_times.append(now)
 
             logger.warning(
-                f"[QUOTA_TRACKER:{self.quota_info.api_name}] "
-                f"Quota error #{self.quota_info.total_quota_errors}: {error_message}"
+                "[QUOTA_TRACKER:%s] Quota error #%d: %s",
+                self.quota_info.api_name, self.quota_info.total_quota_errors, error_message
             )
 
     def _update_counters(self):
         """Update time-based counters"""
-        now = datetime.now()
+        now = time.monotonic()
+        info = self.quota_info
 
-        # Reset minute counter if needed
-        if now - self.quota_info.minute_reset_time > timedelta(minutes=1):
-            self.quota_info.current_minute_count = 0
-            self.quota_info.minute_reset_time = now
+        # Reset minute counter when a new minute bucket starts
+        minute_idx = int(now // 60)
+        if minute_idx != self._minute_bucket_idx:
+            info.current_minute_count = 0
+            self._minute_bucket_idx = minute_idx
 
-        # Reset day counter if needed
-        if now - self.quota_info.day_reset_time > timedelta(days=1):
-            self.quota_info.current_day_count = 0
-            self.quota_info.day_reset_time = now
+            # Reset day counter when a new day bucket starts (only possible
+            # when the minute rolled over too)
+            day_idx = int(now // 86400)
+            if day_idx != self._day_bucket_idx:
+                info.current_day_count = 0
+                self._day_bucket_idx = day_idx
 
-        self.quota_info.current_minute_count += 1
-        self.quota_info.current_day_count += 1
+        info.current_minute_count += 1
+        info.current_day_count += 1
 
     def is_quota_exhausted(self, threshold: float = 0.9) -> bool:
         """
@@ -333,21 +580,25 @@ class APIQuotaTracker:
             True if quota is exhausted or near limit
         """
         with self._lock:
-            if self.quota_info.requests_per_day:
-                usage_ratio = (
-                    self.quota_info.current_day_count /
-                    self.quota_info.requests_per_day
-                )
-                if usage_ratio >= threshold:
-                    return True
-
-            # Check for frequent recent errors (5+ errors in last minute)
-            recent_errors_count = sum(
-                1 for err in self.recent_errors
-                if (datetime.now() - err["timestamp"]).total_seconds() < 60
+            return self._quota_exhausted(threshold)
+
+    def _quota_exhausted(self, threshold: float) -> bool:
+        """is_quota_exhausted body; only reads counters, so safe without the lock"""
+        if self.quota_info.requests_per_day:
+            usage_ratio = (
+                self.quota_info.current_day_count /
+                self.quota_info.requests_per_day
             )
+            if usage_ratio >= threshold:
+                return True
 
-            return recent_errors_count >= 5
+        # Check for frequent recent errors (5+ errors in last minute):
+        # true exactly when the 5th most recent error is recent enough
+        error_times = self._quota_error_times
+        return (
+            len(error_times) == self.EXHAUSTION_ERROR_COUNT
+            and time.monotonic() - error_times[0] < self.EXHAUSTION_ERROR_WINDOW
+        )
 
     def get_quota_recommendations(self) -> str:
         """
@@ -356,89 +607,66 @@ class APIQuotaTracker:
         Returns:
             Markdown-formatted recommendations
         """
-        recommendations = f"""
-## API Quota Recommendations for {self.quota_info.api_name}
-
-### Current Status
-- Total Requests: {self.quota_info.total_requests}
-- Total Quota Errors: {self.quota_info.total_quota_errors}
-- Daily Limit: {self.quota_info.requests_per_day or 'Unknown'}
-- Daily Usage: {self.quota_info.current_day_count}
-
-### Error Rate
-- Recent Errors (last 100): {len(self.recent_errors)}
-- Last Error: {self.quota_info.last_quota_error or 'None'}
-
-### Recommendations
-
-#### 1. Increase API Quota (Google Cloud Console)
-
-**For Google Gemini API:**
-1. Go to [Google Cloud Console](https://console.cloud.google.com/)
-2. Select your project
-3. Navigate to: **APIs & Services** → **Gemini API**
-4. Click **Quotas** tab
-5. Request quota increase:
-   - Current: {self.quota_info.requests_per_day or 'Free tier (1,500 RPD)'}
-   - Recommended: 10,000+ requests per day
-
-**Pricing Tiers:**
-- **Free Tier**: 1,500 requests/day, 60 requests/minute
-- **Paid Tier**: Up to 1,000,000+ requests/day
-- **Enterprise**: Custom limits available
-
-#### 2. Enable Billing
-
-If not already enabled:
-1. Go to **Billing** → **Link a billing account**
-2. Add payment method
-3. Quota limits increase automatically
-
-#### 3. Optimization Strategies
-
-While waiting for quota increase:
-- **Use Circuit Breaker**: Already enabled (fails fast after 5 errors)
-- **Batch Requests**: Combine multiple operations when possible
-- **Cache Results**: Cache frequently used responses
-- **Retry Strategy**: Use exponential backoff (already implemented)
-- **Off-Peak Usage**: Schedule heavy operations during low-traffic hours
-
-#### 4. Alternative Solutions
-
-If quota cannot be increased:
-- **OpenAI Fallback**: Already configured (automatic fallback)
-- **Load Distribution**: Spread load across multiple API keys
-- **Queue System**: Implement request queuing during peak times
-
-### Contact Information
-
-**Google Cloud Support:**
-- Enterprise customers: [Contact Support](https://cloud.google.com/support)
-- Community: [Google Cloud Community](https://www.googlecloudcommunity.com/)
+        info = self.quota_info
+        fields = (
+            info.api_name,
+            info.total_requests,
+            info.total_quota_errors,
+            info.requests_per_day,
+            info.current_day_count,
+            len(self.recent_errors),
+            info.last_quota_error,
+        )
 
-**Estimated Time to Resolution:**
-- Billing enablement: Immediate
-- Quota increase request: 1-2 business days
-- Enterprise custom quotas: 3-5 business days
-"""
+        # Dashboards poll this repeatedly; re-render only when a field changed
+        cached = self._recommendations_cache
+        if cached is not None and cached[0] == fields:
+            return cached[1]
+
+        recommendations = _QUOTA_RECOMMENDATIONS_TEMPLATE.format(
+            api_name=info.api_name,
+            total_requests=info.total_requests,
+            total_quota_errors=info.total_quota_errors,
+            daily_limit=info.requests_per_day or 'Unknown',
+            daily_usage=info.current_day_count,
+            recent_error_count=len(self.recent_errors),
+            last_error=info.last_quota_error or 'None',
+            current_quota=info.requests_per_day or 'Free tier (1,500 RPD)',
+        )
+        self._recommendations_cache = (fields, recommendations)
         return recommendations
 
     def get_stats(self) -> Dict[str, Any]:
         """Get quota tracker statistics"""
         with self._lock:
-            return {
-                "api_name": self.quota_info.api_name,
-                "total_requests": self.quota_info.total_requests,
-                "total_quota_errors": self.quota_info.total_quota_errors,
-                "current_day_count": self.quota_info.current_day_count,
-                "requests_per_day_limit": self.quota_info.requests_per_day,
-                "is_exhausted": self.is_quota_exhausted(),
-                "last_error": (
-                    self.quota_info.last_quota_error.isoformat()
-                    if self.quota_info.last_quota_error else None
-                ),
-                "recent_error_count": len(self.recent_errors)
-            }
+            return self._stats_snapshot()
+
+    def get_stats_lockfree(self) -> Dict[str, Any]:
+        """
+        Get quota tracker statistics without taking the lock.
+
+        Reads plain counters that writers update one attribute at a time, so
+        a snapshot may mix values from either side of a concurrent update;
+        good enough for dashboards.
+        """
+        return self._stats_snapshot()
+
+    def _stats_snapshot(self) -> Dict[str, Any]:
+        """Build the get_stats dict from the current counters"""
+        info = self.quota_info
+        return {
+            "api_name": info.api_name,
+            "total_requests": info.total_requests,
+            "total_quota_errors": info.total_quota_errors,
+            "current_day_count": info.current_day_count,
+            "requests_per_day_limit": info.requests_per_day,
+            "is_exhausted": self._quota_exhausted(0.9),
+            "last_error": (
+                info.last_quota_error.isoformat()
+                if info.last_quota_error else None
+            ),
+            "recent_error_count": len(self.recent_errors)
+        }
 
 
 # =============================================================================
@@ -456,6 +684,9 @@ def get_gemini_rate_limiter() -> RateLimiter:
     - 60 requests per minute
     - 1,500 requests per day
 
+    Batch callers should reserve all slots at once, e.g.
+    ``get_gemini_rate_limiter().acquire_n(len(batch))``.
+
     Returns:
         RateLimiter instance for Gemini API
     """
@@ -487,13 +718,13 @@ def get_gemini_quota_tracker() -> APIQuotaTracker:
 
 
 def get_all_rate_limiter_stats() -> Dict[str, Any]:
-    """Get statistics from all rate limiters"""
+    """Get statistics from all rate limiters (lock-free snapshots for dashboards)"""
     stats = {}
 
     if _gemini_rate_limiter:
-        stats["gemini_rate_limiter"] = _gemini_rate_limiter.get_stats()
+        stats["gemini_rate_limiter"] = _gemini_rate_limiter.get_stats_lockfree()
 
     if _gemini_quota_tracker:
-        stats["gemini_quota_tracker"] = _gemini_quota_tracker.get_stats()
+        stats["gemini_quota_tracker"] = _gemini_quota_tracker.get_stats_lockfree()
 
     return stats
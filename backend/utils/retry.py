@@ -7,11 +7,41 @@ According to CLAUDE.md best practices:
 - Do NOT retry 4xx errors (except 429) - these are client errors that won't resolve
 """
 
+import logging
+import re
 import time
 from typing import Callable, TypeVar, Any
 
+logger = logging.getLogger(__name__)
+
 T = TypeVar('T')
 
+# Retryable HTTP status codes (429 and 5xx) appearing as standalone numbers
+# in an exception message
+_RETRYABLE_STATUS_RE = re.compile(r'\b(429|5\d\d)\b')
+
+# Exception type -> name of the attribute ('status' / 'status_code') that
+# last carried its HTTP status. Retries of one failing call raise the same
+# type repeatedly, so try that attribute first; instances of one type can
+# still differ, so anything else falls back to the full probe.
+_STATUS_ATTR_CACHE = {}
+
+
+def _get_status_attr(e: Exception) -> Any:
+    """Return the HTTP status attribute of an exception, or None"""
+    exc_type = type(e)
+    attr = _STATUS_ATTR_CACHE.get(exc_type)
+    if attr is not None:
+        status = getattr(e, attr, None)
+        if status:
+            return status
+    for name in ('status', 'status_code'):
+        status = getattr(e, name, None)
+        if status:
+            _STATUS_ATTR_CACHE[exc_type] = name
+            return status
+    return None
+
 
 def exponential_backoff_retry(
     func: Callable[[], T],
@@ -50,25 +80,16 @@ def exponential_backoff_retry(
             last_exception = e
 
             # Try to get HTTP status code from the exception
-            status_code = None
-
             # Check for Pinecone-specific exception attributes
-            if hasattr(e, 'status'):
-                status_code = e.status
-            elif hasattr(e, 'status_code'):
-                status_code = e.status_code
+            status_code = _get_status_attr(e)
+
             # Some exceptions might have it in args or message
-            elif hasattr(e, 'args') and e.args:
-                # Try to extract status code from error message
-                error_str = str(e)
-                if '429' in error_str:
-                    status_code = 429
-                elif any(f'{code}' in error_str for code in range(500, 600)):
-                    # Server error 5xx
-                    for code in range(500, 600):
-                        if f'{code}' in error_str:
-                            status_code = code
-                            break
+            if status_code is None and e.args:
+                # Try to extract status code from error message (one regex
+                # scan; 429 wins over 5xx when both appear)
+                codes = _RETRYABLE_STATUS_RE.findall(str(e))
+                if codes:
+                    status_code = 429 if '429' in codes else int(codes[0])
 
             # Determine if error is retryable
             is_retryable = False
@@ -79,7 +100,7 @@ def exponential_backoff_retry(
                     is_retryable = True
                 # Don't retry on other 4xx errors (client errors)
                 elif 400 <= status_code < 500:
-                    print(f"Client error {status_code}: {e}")
+                    logger.warning("Client error %s: %s", status_code, e)
                     raise  # Don't retry client errors
 
             # If we couldn't determine status code, be conservative and retry
@@ -90,12 +111,21 @@ def exponential_backoff_retry(
             # Retry logic
             if is_retryable and attempt < max_retries - 1:
                 delay = min(base_delay * (2 ** attempt), max_delay)
-                error_type = f"Error {status_code}" if status_code else "Error"
-                print(f"{error_type} on attempt {attempt + 1}/{max_retries}: {e}")
-                print(f"Retrying in {delay:.1f}s...")
+                # %-style args: the (possibly multi-KB) exception text is only
+                # formatted if the record is actually emitted
+                if status_code:
+                    logger.warning(
+                        "Error %s on attempt %d/%d: %s. Retrying in %.1fs...",
+                        status_code, attempt + 1, max_retries, e, delay
+                    )
+                else:
+                    logger.warning(
+                        "Error on attempt %d/%d: %s. Retrying in %.1fs...",
+                        attempt + 1, max_retries, e, delay
+                    )
                 time.sleep(delay)
             elif attempt >= max_retries - 1:
-                print(f"Max retries ({max_retries}) exceeded")
+                logger.error("Max retries (%d) exceeded", max_retries)
                 raise
             else:
                 # Non-retryable error
@@ -125,11 +155,11 @@ def retry_on_rate_limit(func: Callable[[], T], max_retries: int = 3) -> T:
         try:
             return func()
         except Exception as e:
-            status_code = getattr(e, 'status', getattr(e, 'status_code', None))
+            status_code = _get_status_attr(e)
 
             if status_code == 429 and attempt < max_retries - 1:
                 delay = 2 ** attempt  # 1s, 2s, 4s
-                print(f"Rate limit hit, retrying in {delay}s...")
+                logger.warning("Rate limit hit, retrying in %ds...", delay)
                 time.sleep(delay)
             else:
                 raise
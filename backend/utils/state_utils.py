@@ -11,6 +11,55 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Fields shared by every workflow state type (see extract_common_state)
+_COMMON_FIELDS = frozenset({
+    'user_input', 'session_id', 'product_type', 'schema',
+    'provided_requirements', 'missing_requirements', 'is_requirements_valid',
+    'current_step', 'messages', 'response', 'error'
+})
+
+# Fields sanitize_state_for_logging always summarizes (large data)
+_SANITIZE_EXCLUDES = frozenset({
+    'pdf_content', 'products_data', 'parallel_analysis_results',
+    'vendor_analysis', 'messages', 'rag_context'
+})
+
+# id(enum member) -> (member, member.value). Keyed by identity so mixin enums
+# (e.g. IntEnum members equal to plain ints) never collide with other values;
+# holding the member keeps its id from being reused.
+_ENUM_VALUE_CACHE: Dict[int, tuple] = {}
+_NOT_ENUM = object()
+
+# enum class -> (exact value map, lower-cased value map) of its str-valued
+# members, built on first use by safe_str_to_enum
+_STR_ENUM_LOOKUP: Dict[type, tuple] = {}
+
+
+def _str_enum_lookup(enum_class: type) -> tuple:
+    """Return (exact, case-insensitive) str value -> member maps for enum_class"""
+    lookup = _STR_ENUM_LOOKUP.get(enum_class)
+    if lookup is None:
+        exact = {}
+        folded = {}
+        for enum_item in enum_class:
+            if isinstance(enum_item.value, str):
+                exact.setdefault(enum_item.value, enum_item)
+                # First member wins, as in the old linear scan
+                folded.setdefault(enum_item.value.lower(), enum_item)
+        lookup = _STR_ENUM_LOOKUP[enum_class] = (exact, folded)
+    return lookup
+
+
+def _enum_value(value: Any, default: Any) -> Any:
+    """Return value.value if `value` is an Enum member, else `default`"""
+    hit = _ENUM_VALUE_CACHE.get(id(value))
+    if hit is not None and hit[0] is value:
+        return hit[1]
+    if isinstance(value, Enum):
+        _ENUM_VALUE_CACHE[id(value)] = (value, value.value)
+        return value.value
+    return default
+
 
 class StateConversionError(Exception):
     """Raised when state conversion fails"""
@@ -36,14 +85,19 @@ def safe_str_to_enum(value: Any, enum_class: type, default: Optional[Any] = None
         return value
 
     if isinstance(value, str):
+        exact, folded = _str_enum_lookup(enum_class)
+
+        # Try direct match, then case-insensitive match
+        enum_item = exact.get(value)
+        if enum_item is None:
+            enum_item = folded.get(value.lower())
+        if enum_item is not None:
+            return enum_item
+
         try:
-            # Try direct match
+            # Non-str values or a custom _missing_ hook
             return enum_class(value)
         except ValueError:
-            # Try case-insensitive match
-            for enum_item in enum_class:
-                if enum_item.value.lower() == value.lower():
-                    return enum_item
             logger.warning(f"Could not convert '{value}' to {enum_class.__name__}, using default")
             return default
 
@@ -64,8 +118,12 @@ def safe_enum_to_str(value: Any, default: str = "") -> str:
     if value is None:
         return default
 
-    if isinstance(value, Enum):
-        return value.value
+    if type(value) is str:
+        return value
+
+    value_str = _enum_value(value, _NOT_ENUM)
+    if value_str is not _NOT_ENUM:
+        return value_str
 
     if isinstance(value, str):
         return value
@@ -86,8 +144,12 @@ def normalize_intent(intent: Any) -> Optional[str]:
     if intent is None:
         return None
 
-    if isinstance(intent, Enum):
-        return intent.value
+    if type(intent) is str:
+        return intent
+
+    value = _enum_value(intent, _NOT_ENUM)
+    if value is not _NOT_ENUM:
+        return value
 
     return str(intent)
 
@@ -150,13 +212,11 @@ def merge_states(base_state: Dict[str, Any], update_state: Dict[str, Any],
     Returns:
         Merged state dictionary
     """
-    merged = base_state.copy()
+    # Dict unpacking merges in C instead of a per-key Python loop
+    if preserve_none:
+        return {**base_state, **update_state}
 
-    for key, value in update_state.items():
-        if preserve_none or value is not None:
-            merged[key] = value
-
-    return merged
+    return {**base_state, **{key: value for key, value in update_state.items() if value is not None}}
 
 
 def extract_common_state(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -169,17 +229,8 @@ def extract_common_state(state: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dictionary with common fields only
     """
-    common_fields = {
-        'user_input', 'session_id', 'product_type', 'schema',
-        'provided_requirements', 'missing_requirements', 'is_requirements_valid',
-        'current_step', 'messages', 'response', 'error'
-    }
-
-    return {
-        key: state.get(key)
-        for key in common_fields
-        if key in state
-    }
+    # keys() & frozenset intersects in C, probing from the smaller side
+    return {key: state[key] for key in state.keys() & _COMMON_FIELDS}
 
 
 def convert_workflow_state_to_solution(workflow_state: Dict[str, Any]) -> Dict[str, Any]:
@@ -271,18 +322,13 @@ def sanitize_state_for_logging(state: Dict[str, Any],
     Returns:
         Sanitized state dictionary safe for logging
     """
-    # Default fields to exclude (large data)
-    default_excludes = {
-        'pdf_content', 'products_data', 'parallel_analysis_results',
-        'vendor_analysis', 'messages', 'rag_context'
-    }
-
+    excludes = _SANITIZE_EXCLUDES
     if exclude_fields:
-        default_excludes.update(exclude_fields)
+        excludes = excludes.union(exclude_fields)
 
     sanitized = {}
     for key, value in state.items():
-        if key in default_excludes:
+        if key in excludes:
             if isinstance(value, (list, dict)):
                 sanitized[key] = f"<{type(value).__name__} with {len(value)} items>"
             else:
@@ -293,6 +339,40 @@ def sanitize_state_for_logging(state: Dict[str, Any],
     return sanitized
 
 
+class _LazySanitizedState:
+    """Defers sanitize_state_for_logging until the log record is formatted"""
+
+    __slots__ = ('_state', '_exclude_fields')
+
+    def __init__(self, state: Dict[str, Any], exclude_fields: Optional[list]):
+        self._state = state
+        self._exclude_fields = exclude_fields
+
+    def __str__(self) -> str:
+        return str(sanitize_state_for_logging(self._state, self._exclude_fields))
+
+    __repr__ = __str__
+
+
+def sanitize_state_for_logging_lazy(state: Dict[str, Any],
+                                     exclude_fields: Optional[list] = None) -> _LazySanitizedState:
+    """
+    Lazy variant of sanitize_state_for_logging for use as a %-style log argument.
+
+    The state is only walked if the record is actually emitted, so
+    ``logger.debug("state: %s", sanitize_state_for_logging_lazy(state))``
+    costs one small allocation when DEBUG is disabled.
+
+    Args:
+        state: State dictionary
+        exclude_fields: Additional fields to exclude
+
+    Returns:
+        Object whose str() is the sanitized state
+    """
+    return _LazySanitizedState(state, exclude_fields)
+
+
 __all__ = [
     'StateConversionError',
     'safe_str_to_enum',
@@ -306,4 +386,5 @@ __all__ = [
     'convert_solution_state_to_workflow',
     'validate_state_fields',
     'sanitize_state_for_logging',
+    'sanitize_state_for_logging_lazy',
 ]
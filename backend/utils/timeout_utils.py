@@ -5,15 +5,74 @@ Provides decorators and context managers for timeout handling.
 """
 
 import functools
+import queue
 import signal
 import logging
-from typing import Any, Callable, Optional
-from concurrent.futures import TimeoutError as FuturesTimeoutError
 import threading
+import time
+from typing import Any, Callable, Optional
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
 
 logger = logging.getLogger(__name__)
 
 
+class _DaemonPool:
+    """
+    Reusable daemon worker threads for with_timeout.
+
+    Idle workers are reused across calls; a new worker is started whenever
+    none is idle, so hung calls never starve later ones. Workers are daemon
+    threads (never joined at interpreter exit) and retire after sitting idle
+    for idle_timeout seconds.
+    """
+
+    def __init__(self, idle_timeout: float = 60.0):
+        self._tasks: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._idle = 0
+        self._idle_timeout = idle_timeout
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        future: Future = Future()
+        with self._lock:
+            reuse = self._idle > 0
+            if reuse:
+                self._idle -= 1
+        self._tasks.put((future, func, args, kwargs))
+        if not reuse:
+            threading.Thread(target=self._worker, name="timeout", daemon=True).start()
+        return future
+
+    def _worker(self) -> None:
+        while True:
+            try:
+                future, func, args, kwargs = self._tasks.get(timeout=self._idle_timeout)
+            except queue.Empty:
+                with self._lock:
+                    if self._idle > 0:
+                        self._idle -= 1
+                        return
+                # A submitter claimed this worker; its task is on the way
+                continue
+
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = func(*args, **kwargs)
+                except BaseException as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+            del future, func, args, kwargs
+
+            with self._lock:
+                self._idle += 1
+
+
+# Shared workers for with_timeout. A call that times out keeps its worker
+# until it returns; other calls get a fresh worker meanwhile.
+_TIMEOUT_POOL = _DaemonPool()
+
+
 class TimeoutException(Exception):
     """Raised when an operation exceeds its timeout"""
     pass
@@ -39,29 +98,16 @@ def with_timeout(seconds: int):
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # Use threading for timeout (works on Windows)
-            result = [TimeoutException("Function timed out")]
-
-            def target():
-                try:
-                    result[0] = func(*args, **kwargs)
-                except Exception as e:
-                    result[0] = e
-
-            thread = threading.Thread(target=target)
-            thread.daemon = True
-            thread.start()
-            thread.join(timeout=seconds)
-
-            if thread.is_alive():
+            # Run on the shared daemon pool (works on Windows, unlike signals)
+            future = _TIMEOUT_POOL.submit(func, *args, **kwargs)
+            try:
+                return future.result(timeout=seconds)
+            except FuturesTimeoutError:
+                # Only stops calls still queued; a running call cannot be interrupted
+                future.cancel()
                 logger.error(f"{func.__name__} timed out after {seconds}s")
                 raise TimeoutException(f"{func.__name__} exceeded timeout of {seconds}s")
 
-            if isinstance(result[0], Exception):
-                raise result[0]
-
-            return result[0]
-
         return wrapper
     return decorator
 
@@ -123,27 +169,33 @@ def batch_invoke_with_timeout(chain, inputs: list, timeout: int = 120) -> list:
 
 class TimeoutContext:
     """
-    Context manager for timeout operations.
+    Context manager for cooperative timeouts.
+
+    The block is not interrupted; it calls check() at convenient points and
+    gets a TimeoutException once the deadline has passed. For a hard limit
+    on a single call, use with_timeout instead.
 
     Usage:
-        with TimeoutContext(30):
-            result = expensive_operation()
+        with TimeoutContext(30) as ctx:
+            for item in items:
+                ctx.check()
+                process(item)
     """
     def __init__(self, seconds: int):
         self.seconds = seconds
-        self.timer = None
+        # Also set here so check() works before __enter__; re-armed on entry
+        self.deadline = time.monotonic() + seconds
 
     def __enter__(self):
-        def timeout_handler():
-            raise TimeoutException(f"Operation exceeded timeout of {self.seconds}s")
-
-        self.timer = threading.Timer(self.seconds, timeout_handler)
-        self.timer.start()
+        self.deadline = time.monotonic() + self.seconds
         return self
 
+    def check(self):
+        """Raise TimeoutException if the deadline has passed"""
+        if time.monotonic() > self.deadline:
+            raise TimeoutException(f"Operation exceeded timeout of {self.seconds}s")
+
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.timer:
-            self.timer.cancel()
         return False
 
 
@@ -4,13 +4,40 @@
 
 import re
 import logging
-from typing import Optional, Tuple, Dict, Any
-from dataclasses import dataclass
+import functools
+from typing import Optional, Tuple, Dict, Any, List, Callable
+from dataclasses import dataclass, replace
+
+# NumPy vectorizes ranges_compatible_bulk; without it the bulk call falls
+# back to a per-product loop
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+# Precompiled patterns (parsing runs in the product-matching hot loop)
+# Pattern: number (with optional decimal) + optional space + unit
+_PRESSURE_RE = re.compile(r'([-+]?\d+\.?\d*)\s*(bar|psi|kpa|mpa|pa|barg|psig)')
+# Pattern for temperature with various formats
+_TEMP_RE = re.compile(r'([-+]?\d+\.?\d*)\s*(?:°|deg|degree)?\s*([cfk])\b')
+# Pattern for flow rates: slash units (group 2) or units without slash like
+# "gpm", "cfm" (group 3), in one scan
+_FLOW_RE = re.compile(r'([-+]?\d+\.?\d*)\s*(?:([a-z³3]+/[a-z]+)|(gpm|cfm|lpm))')
+# Pattern for ranges: min-max or min to max or min...max
+_RANGE_RE = re.compile(r'([-+]?\d+\.?\d*)\s*(?:-|to|\.\.\.)\s*([-+]?\d+\.?\d*)\s*(.+)')
+
+# Substring hints for values_equivalent's type auto-detection, one scan per
+# type, checked in priority order ("pa" also covers "kpa"/"mpa")
+_PRESSURE_HINT_RE = re.compile(r'bar|psi|pa')
+_TEMPERATURE_HINT_RE = re.compile(r'°[cf]|deg [cf]| [cfk]|celsius|fahrenheit')
+_FLOW_HINT_RE = re.compile(r'm3/h|gpm|l/min|cfm')
+
+
+@dataclass(frozen=True, slots=True)
 class UnitValue:
     """Represents a value with its unit"""
     value: float
@@ -21,7 +48,7 @@ class UnitValue:
         return f"{self.value} {self.unit}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Range:
     """Represents a range with min/max values and unit"""
     min_value: float
@@ -41,6 +68,28 @@ class Range:
         return not (self.max_value < other.min_value or self.min_value > other.max_value)
 
 
+def _range_compat_kernel(req_min: float, req_max: float, product_min, product_max) -> Tuple[list, list, list]:
+    """
+    Array form of Range.contains/overlaps plus overlap percentage.
+
+    product_min/product_max are float64 arrays already in the required
+    range's unit. Returns Python lists (contains, overlaps, overlap_pct);
+    overlap_pct follows ranges_compatible, i.e. 0 when the required range is
+    empty.
+    """
+    contains = (product_min <= req_min) & (product_max >= req_max)
+    overlaps = ~((product_max < req_min) | (product_min > req_max))
+
+    req_size = req_max - req_min
+    if req_size > 0:
+        overlap_size = np.minimum(req_max, product_max) - np.maximum(req_min, product_min)
+        overlap_pct = (overlap_size / req_size * 100).tolist()
+    else:
+        overlap_pct = [0] * len(product_min)
+
+    return contains.tolist(), overlaps.tolist(), overlap_pct
+
+
 class IndustrialUnitConverter:
     """
     Converts between common industrial units for process instrumentation.
@@ -110,21 +159,63 @@ class IndustrialUnitConverter:
         "megapascal": "mpa",
     }
 
+    # Pure string -> result methods memoized per instance; batch product
+    # matching parses the same handful of strings over and over. Cached
+    # UnitValue/Range results are shared, hence frozen.
+    CACHED_METHODS = (
+        "normalize_unit_string",
+        "parse_pressure",
+        "parse_temperature",
+        "parse_flow",
+        "_parse_range",
+    )
+    CACHE_SIZE = 4096
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
+        for name in self.CACHED_METHODS:
+            setattr(self, name, functools.lru_cache(maxsize=self.CACHE_SIZE)(getattr(self, name)))
+
+        self._build_tables()
+
+    def _build_tables(self):
+        """Precompute the alias lookup, unit -> value type tags and (from_unit, to_unit) -> multiplier tables"""
+        # Aliases keyed by their normalized (lowercase, whitespace-free) form,
+        # so multi-word aliases like "deg c" match normalized input
+        self._unit_aliases = {
+            "".join(alias.lower().split()): unit
+            for alias, unit in self.UNIT_ALIASES.items()
+        }
+        self._unit_type = {
+            **{u: "pressure" for u in self.PRESSURE_UNITS},
+            **{u: "temperature" for u in ("c", "f", "k")},
+            **{u: "flow" for u in self.FLOW_UNITS},
+        }
+        self._pressure_factors = {
+            (a, b): va / vb
+            for a, va in self.PRESSURE_UNITS.items()
+            for b, vb in self.PRESSURE_UNITS.items()
+        }
+        self._flow_factors = {
+            (a, b): va / vb
+            for a, va in self.FLOW_UNITS.items()
+            for b, vb in self.FLOW_UNITS.items()
+        }
+
+    def clear_caches(self):
+        """Drop memoized results; call after changing the unit tables at runtime"""
+        for name in self.CACHED_METHODS:
+            getattr(self, name).cache_clear()
+        self._build_tables()
+
     def normalize_unit_string(self, unit_str: str) -> str:
         """Normalize unit string to standard form"""
-        unit_lower = unit_str.lower().strip()
-
-        # Remove extra spaces
-        unit_lower = re.sub(r'\s+', '', unit_lower)
+        # Lowercase and drop all whitespace (split() + join runs in C)
+        unit_lower = "".join(unit_str.lower().split())
 
         # Apply aliases
-        if unit_lower in self.UNIT_ALIASES:
-            return self.UNIT_ALIASES[unit_lower]
-
-        return unit_lower
+        return self._unit_aliases.get(unit_lower, unit_lower)
 
     def parse_pressure(self, value_str: str) -> Optional[UnitValue]:
         """
@@ -135,10 +226,7 @@ class IndustrialUnitConverter:
             "145 psi" → UnitValue(145.0, "psi")
             "1.5 MPa" → UnitValue(1.5, "MPa")
         """
-        # Pattern: number (with optional decimal) + optional space + unit
-        pattern = r'([-+]?\d+\.?\d*)\s*(bar|psi|kpa|mpa|pa|barg|psig)'
-
-        match = re.search(pattern, value_str.lower())
+        match = _PRESSURE_RE.search(value_str.lower())
         if not match:
             return None
 
@@ -156,10 +244,7 @@ class IndustrialUnitConverter:
             "212 °F" → UnitValue(212.0, "f")
             "373 K" → UnitValue(373.0, "k")
         """
-        # Pattern for temperature with various formats
-        pattern = r'([-+]?\d+\.?\d*)\s*(?:°|deg|degree)?\s*([cfk])\b'
-
-        match = re.search(pattern, value_str.lower())
+        match = _TEMP_RE.search(value_str.lower())
         if not match:
             return None
 
@@ -176,19 +261,12 @@ class IndustrialUnitConverter:
             "100 m3/h" → UnitValue(100.0, "m3/h")
             "10 GPM" → UnitValue(10.0, "gpm")
         """
-        # Pattern for flow rates
-        pattern = r'([-+]?\d+\.?\d*)\s*([a-z³3]+/[a-z]+)'
-
-        match = re.search(pattern, value_str.lower())
+        match = _FLOW_RE.search(value_str.lower())
         if not match:
-            # Try without slash (like "gpm", "cfm")
-            pattern2 = r'([-+]?\d+\.?\d*)\s*(gpm|cfm|lpm)'
-            match = re.search(pattern2, value_str.lower())
-            if not match:
-                return None
+            return None
 
         value = float(match.group(1))
-        unit = self.normalize_unit_string(match.group(2))
+        unit = self.normalize_unit_string(match.group(2) or match.group(3))
 
         return UnitValue(value, unit, value_str)
 
@@ -207,14 +285,12 @@ class IndustrialUnitConverter:
         from_unit_norm = self.normalize_unit_string(from_unit)
         to_unit_norm = self.normalize_unit_string(to_unit)
 
-        if from_unit_norm not in self.PRESSURE_UNITS or to_unit_norm not in self.PRESSURE_UNITS:
+        # Single precomputed from->to factor (bar-based ratio)
+        factor = self._pressure_factors.get((from_unit_norm, to_unit_norm))
+        if factor is None:
             return None
 
-        # Convert to bar first, then to target unit
-        in_bar = from_value * self.PRESSURE_UNITS[from_unit_norm]
-        result = in_bar / self.PRESSURE_UNITS[to_unit_norm]
-
-        return result
+        return from_value * factor
 
     def convert_temperature(self, from_value: float, from_unit: str, to_unit: str = "c") -> Optional[float]:
         """
@@ -266,14 +342,12 @@ class IndustrialUnitConverter:
         from_unit_norm = self.normalize_unit_string(from_unit)
         to_unit_norm = self.normalize_unit_string(to_unit)
 
-        if from_unit_norm not in self.FLOW_UNITS or to_unit_norm not in self.FLOW_UNITS:
+        # Single precomputed from->to factor (m3/h-based ratio)
+        factor = self._flow_factors.get((from_unit_norm, to_unit_norm))
+        if factor is None:
             return None
 
-        # Convert to m3/h first, then to target unit
-        in_m3h = from_value * self.FLOW_UNITS[from_unit_norm]
-        result = in_m3h / self.FLOW_UNITS[to_unit_norm]
-
-        return result
+        return from_value * factor
 
     def parse_range(self, range_str: str, value_type: str = "auto") -> Optional[Range]:
         """
@@ -291,10 +365,12 @@ class IndustrialUnitConverter:
         Returns:
             Range object or None if parsing fails
         """
-        # Pattern for ranges: min-max or min to max or min...max
-        pattern = r'([-+]?\d+\.?\d*)\s*(?:-|to|\.\.\.)\s*([-+]?\d+\.?\d*)\s*(.+)'
+        # value_type does not affect parsing; keep it out of the cache key
+        return self._parse_range(range_str)
 
-        match = re.search(pattern, range_str.lower())
+    def _parse_range(self, range_str: str) -> Optional[Range]:
+        """parse_range body, memoized on the range string alone"""
+        match = _RANGE_RE.search(range_str.lower())
         if not match:
             return None
 
@@ -346,63 +422,154 @@ class IndustrialUnitConverter:
             }
 
         # Try to normalize units if different
-        if req_range.unit != product_range.unit:
-            # Detect value type and convert
-            if req_range.unit in self.PRESSURE_UNITS and product_range.unit in self.PRESSURE_UNITS:
-                # Convert product range to req range units
-                product_range.min_value = self.convert_pressure(
-                    product_range.min_value, product_range.unit, req_range.unit
-                )
-                product_range.max_value = self.convert_pressure(
-                    product_range.max_value, product_range.unit, req_range.unit
-                )
-                product_range.unit = req_range.unit
-            elif req_range.unit in ["c", "f", "k"] and product_range.unit in ["c", "f", "k"]:
-                # Convert product range to req range units
-                product_range.min_value = self.convert_temperature(
-                    product_range.min_value, product_range.unit, req_range.unit
-                )
-                product_range.max_value = self.convert_temperature(
-                    product_range.max_value, product_range.unit, req_range.unit
-                )
-                product_range.unit = req_range.unit
-            elif req_range.unit in self.FLOW_UNITS and product_range.unit in self.FLOW_UNITS:
-                # Convert product range to req range units
-                product_range.min_value = self.convert_flow(
-                    product_range.min_value, product_range.unit, req_range.unit
-                )
-                product_range.max_value = self.convert_flow(
-                    product_range.max_value, product_range.unit, req_range.unit
+        convert = self._range_converter(req_range.unit, product_range.unit)
+        if convert is not None:
+            # Convert product range to req range units
+            product_range = replace(
+                product_range,
+                min_value=convert(product_range.min_value, product_range.unit, req_range.unit),
+                max_value=convert(product_range.max_value, product_range.unit, req_range.unit),
+                unit=req_range.unit
+            )
+
+        # Check compatibility (Range.contains/overlaps inlined on local floats)
+        req_min, req_max = req_range.min_value, req_range.max_value
+        product_min, product_max = product_range.min_value, product_range.max_value
+        contains = product_min <= req_min and product_max >= req_max
+        overlaps = not (product_max < req_min or product_min > req_max)
+
+        overlap_pct = 0.0
+        if overlaps and not contains:
+            # Calculate overlap percentage
+            overlap_min = max(req_min, product_min)
+            overlap_max = min(req_max, product_max)
+            overlap_size = overlap_max - overlap_min
+            req_size = req_max - req_min
+
+            overlap_pct = (overlap_size / req_size * 100) if req_size > 0 else 0
+
+        return self._compatibility_result(
+            str(req_range), str(product_range), contains, overlaps, overlap_pct
+        )
+
+    def ranges_compatible_bulk(
+        self,
+        req_range_str: str,
+        product_range_strs: List[str],
+        value_type: str = "auto"
+    ) -> List[Dict[str, Any]]:
+        """
+        Check many product ranges against one required range.
+
+        Equivalent to calling ranges_compatible for each product string, but
+        the required range is parsed once and, with NumPy available, unit
+        conversion and the contains/overlap arithmetic run as array
+        operations per product unit instead of per product.
+
+        Args:
+            req_range_str: Required range string (e.g., "0-100 °C")
+            product_range_strs: Product range strings
+            value_type: Type of value for unit conversion
+
+        Returns:
+            List of ranges_compatible dicts, in product order
+        """
+        if not NUMPY_AVAILABLE:
+            return [
+                self.ranges_compatible(req_range_str, product_range_str, value_type)
+                for product_range_str in product_range_strs
+            ]
+
+        req_range = self.parse_range(req_range_str, value_type)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(product_range_strs)
+
+        # Parseable product ranges grouped by unit: unit -> (indices, mins, maxs)
+        groups: Dict[str, Tuple[list, list, list]] = {}
+        for i, product_range_str in enumerate(product_range_strs):
+            product_range = self.parse_range(product_range_str, value_type)
+            if not req_range or not product_range:
+                results[i] = {
+                    "compatible": False,
+                    "reason": "Could not parse range strings",
+                    "req_range": req_range_str,
+                    "product_range": product_range_str
+                }
+                continue
+            indices, mins, maxs = groups.setdefault(product_range.unit, ([], [], []))
+            indices.append(i)
+            mins.append(product_range.min_value)
+            maxs.append(product_range.max_value)
+
+        if not groups:
+            return results
+
+        req_str = str(req_range)
+        req_min = req_range.min_value
+        req_max = req_range.max_value
+
+        for unit, (indices, mins, maxs) in groups.items():
+            product_min = np.array(mins, dtype=np.float64)
+            product_max = np.array(maxs, dtype=np.float64)
+
+            # The scalar converters are plain arithmetic, so they accept arrays
+            convert = self._range_converter(req_range.unit, unit)
+            if convert is not None:
+                product_min = convert(product_min, unit, req_range.unit)
+                product_max = convert(product_max, unit, req_range.unit)
+                unit = req_range.unit
+
+            contains, overlaps, overlap_pcts = _range_compat_kernel(
+                req_min, req_max, product_min, product_max
+            )
+
+            for i, min_value, max_value, c, o, pct in zip(
+                indices, product_min.tolist(), product_max.tolist(),
+                contains, overlaps, overlap_pcts
+            ):
+                results[i] = self._compatibility_result(
+                    req_str, f"{min_value}-{max_value} {unit}", c, o, pct if o else 0.0
                 )
-                product_range.unit = req_range.unit
 
-        # Check compatibility
-        contains = product_range.contains(req_range)
-        overlaps = product_range.overlaps(req_range)
+        return results
+
+    def _range_converter(self, req_unit: str, product_unit: str) -> Optional[Callable]:
+        """Converter from product_unit to req_unit, or None if no conversion applies"""
+        if req_unit == product_unit:
+            return None
+        # Detect value type
+        value_type = self._unit_type.get(req_unit)
+        if value_type is None or value_type != self._unit_type.get(product_unit):
+            return None
+        if value_type == "pressure":
+            return self.convert_pressure
+        if value_type == "temperature":
+            return self.convert_temperature
+        return self.convert_flow
 
+    @staticmethod
+    def _compatibility_result(
+        req_range_str: str,
+        product_range_str: str,
+        contains: bool,
+        overlaps: bool,
+        overlap_pct: float
+    ) -> Dict[str, Any]:
+        """Build the ranges_compatible result dict"""
         if contains:
             return {
                 "compatible": True,
                 "reason": f"Product range fully contains required range",
-                "req_range": str(req_range),
-                "product_range": str(product_range),
+                "req_range": req_range_str,
+                "product_range": product_range_str,
                 "contains": True,
                 "overlap_percentage": 100.0
             }
         elif overlaps:
-            # Calculate overlap percentage
-            overlap_min = max(req_range.min_value, product_range.min_value)
-            overlap_max = min(req_range.max_value, product_range.max_value)
-            overlap_size = overlap_max - overlap_min
-            req_size = req_range.max_value - req_range.min_value
-
-            overlap_pct = (overlap_size / req_size * 100) if req_size > 0 else 0
-
             return {
                 "compatible": True,
                 "reason": f"Ranges overlap by {overlap_pct:.0f}%",
-                "req_range": str(req_range),
-                "product_range": str(product_range),
+                "req_range": req_range_str,
+                "product_range": product_range_str,
                 "contains": False,
                 "overlap_percentage": overlap_pct
             }
@@ -410,8 +577,8 @@ class IndustrialUnitConverter:
             return {
                 "compatible": False,
                 "reason": "Ranges do not overlap",
-                "req_range": str(req_range),
-                "product_range": str(product_range),
+                "req_range": req_range_str,
+                "product_range": product_range_str,
                 "contains": False,
                 "overlap_percentage": 0.0
             }
@@ -443,11 +610,12 @@ class IndustrialUnitConverter:
         """
         # Auto-detect value type if not specified
         if value_type == "auto":
-            if any(u in value1_str.lower() for u in ["bar", "psi", "pa", "kpa", "mpa"]):
+            value1_lower = value1_str.lower()
+            if _PRESSURE_HINT_RE.search(value1_lower):
                 value_type = "pressure"
-            elif any(u in value1_str.lower() for u in ["°c", "°f", "deg c", "deg f", " c", " f", " k", "celsius", "fahrenheit"]):
+            elif _TEMPERATURE_HINT_RE.search(value1_lower):
                 value_type = "temperature"
-            elif any(u in value1_str.lower() for u in ["m3/h", "gpm", "l/min", "cfm"]):
+            elif _FLOW_HINT_RE.search(value1_lower):
                 value_type = "flow"
 
         # Parse values based on type
@@ -499,12 +667,10 @@ class IndustrialUnitConverter:
         }
 
 
-# Singleton instance
-_converter = None
+# Singleton instance, created at import so concurrent first calls cannot
+# race to build two converters (and two sets of parse caches)
+_converter = IndustrialUnitConverter()
 
 def get_unit_converter() -> IndustrialUnitConverter:
     """Get singleton unit converter instance"""
-    global _converter
-    if _converter is None:
-        _converter = IndustrialUnitConverter()
     return _converter
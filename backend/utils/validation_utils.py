@@ -7,11 +7,21 @@ before processing, preventing runtime errors.
 
 import functools
 import logging
-from typing import Any, Callable, Dict, List, Optional, Union
-from pydantic import BaseModel, ValidationError
+import types
+from enum import Enum
+from typing import Annotated, Any, Callable, Dict, List, Literal, Optional, Union, get_args, get_origin
+from pydantic import BaseModel, Field, Strict, TypeAdapter, ValidationError
 
 logger = logging.getLogger(__name__)
 
+# Compiled (pydantic-core) validator for the vendor-list shape: a non-empty
+# list of strings. Failures are re-checked in Python to raise the same
+# messages as before. Blank names are checked with str.strip(), whose
+# whitespace set differs from pydantic's strip_whitespace.
+_VENDOR_LIST_ADAPTER = TypeAdapter(
+    Annotated[List[Annotated[str, Strict()]], Field(min_length=1), Strict()]
+)
+
 
 class ValidationException(Exception):
     """Raised when input validation fails"""
@@ -84,6 +94,11 @@ def validate_list(value: Any, field_name: str, min_items: int = 0, max_items: Op
         raise ValidationException(f"{field_name} must have at most {max_items} items")
 
     if item_type:
+        # Fast path: homogeneous lists of exactly item_type (type() mapped
+        # in C); subclasses and mismatches go through the isinstance loop
+        if set(map(type, value)) <= {item_type}:
+            return
+
         for i, item in enumerate(value):
             if not isinstance(item, item_type):
                 raise ValidationException(
@@ -136,6 +151,41 @@ def validate_numeric(value: Any, field_name: str, min_value: Optional[float] = N
         raise ValidationException(f"{field_name} must be at most {max_value}")
 
 
+# Field types whose validated values model_dump() returns unchanged
+_PLAIN_LEAF_TYPES = (str, int, float, bool, type(None))
+_PLAIN_CONTAINERS = (list, dict, tuple, set, frozenset, Union, Literal)
+
+
+def _is_plain_annotation(annotation: Any) -> bool:
+    """True if values of this type contain no models/dataclasses for model_dump() to convert"""
+    if annotation in _PLAIN_LEAF_TYPES:
+        return True
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        # model_dump() keeps enum members in python mode
+        return True
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return True
+    if origin is Annotated:
+        return _is_plain_annotation(get_args(annotation)[0])
+    if origin in _PLAIN_CONTAINERS or isinstance(annotation, types.UnionType):
+        return all(arg is Ellipsis or _is_plain_annotation(arg) for arg in get_args(annotation))
+    return False
+
+
+def _dump_is_shallow(schema: type) -> bool:
+    """True if schema.model_dump() equals a copy of the instance __dict__"""
+    decorators = schema.__pydantic_decorators__
+    return (
+        schema.model_config.get("extra") != "allow"
+        and not schema.model_computed_fields
+        and not decorators.field_serializers
+        and not decorators.model_serializers
+        and not any(f.exclude for f in schema.model_fields.values())
+        and all(_is_plain_annotation(f.annotation) for f in schema.model_fields.values())
+    )
+
+
 def validate_tool_input(schema: BaseModel):
     """
     Decorator to validate tool input against Pydantic schema.
@@ -150,13 +200,19 @@ def validate_tool_input(schema: BaseModel):
             ...
     """
     def decorator(func: Callable) -> Callable:
+        # Resolved once per decorated tool rather than per call
+        model_validate = schema.model_validate
+        shallow = _dump_is_shallow(schema)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 # Validate kwargs against schema
                 if kwargs:
-                    validated = schema(**kwargs)
-                    kwargs = validated.dict()
+                    validated = model_validate(kwargs)
+                    # Plain-typed fields: the validated attributes already are
+                    # what model_dump() would rebuild, so skip that traversal
+                    kwargs = dict(validated.__dict__) if shallow else validated.model_dump()
                 return func(*args, **kwargs)
             except ValidationError as e:
                 logger.error(f"Input validation failed for {func.__name__}: {e}")
@@ -165,6 +221,9 @@ def validate_tool_input(schema: BaseModel):
     return decorator
 
 
+_MISSING = object()
+
+
 def safe_get(data: dict, key: str, default: Any = None, required: bool = False) -> Any:
     """
     Safely get value from dictionary with validation.
@@ -181,12 +240,14 @@ def safe_get(data: dict, key: str, default: Any = None, required: bool = False)
     Raises:
         ValidationException: If required=True and key missing
     """
-    if key not in data:
+    # One hash lookup; the sentinel tells a missing key from a stored None
+    value = data.get(key, _MISSING)
+    if value is _MISSING:
         if required:
             raise ValidationException(f"Required key '{key}' missing from input")
         return default
 
-    return data[key]
+    return value
 
 
 def validate_vendor_list(vendors: List[str], field_name: str = "vendors") -> None:
@@ -200,7 +261,11 @@ def validate_vendor_list(vendors: List[str], field_name: str = "vendors") -> Non
     Raises:
         ValidationException: If validation fails
     """
-    validate_list(vendors, field_name, min_items=1, item_type=str)
+    try:
+        _VENDOR_LIST_ADAPTER.validate_python(vendors)
+    except ValidationError:
+        # Slow path: pinpoint the failure with the original messages
+        validate_list(vendors, field_name, min_items=1, item_type=str)
 
     for vendor in vendors:
         if not vendor.strip():
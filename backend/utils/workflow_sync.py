@@ -6,19 +6,62 @@ for LangGraph workflows to prevent race conditions and ensure data consistency.
 """
 
 import functools
+import inspect
+import io
 import logging
 import threading
 import time
+import weakref
 import copy
-from typing import Any, Callable, Dict, Optional, TypeVar
+import pickle
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
 from contextlib import contextmanager
-from datetime import datetime, timedelta
+from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
 
+class _NotPlainState(Exception):
+    """Raised by _PlainPickler on the first object that is not a plain builtin"""
+
+
+class _PlainPickler(pickle.Pickler):
+    """
+    Pickler that refuses anything but exact builtin containers and scalars.
+
+    The C pickler handles exact dict/list/tuple/set/str/int/float/bytes/bool/
+    None itself and only consults reducer_override for everything else
+    (subclasses, dataclasses, clients, functions), so any call here means
+    the state is not plain.
+    """
+
+    def reducer_override(self, obj):
+        raise _NotPlainState
+
+
+def _snapshot_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Deep copy a state dict for rollback.
+
+    A C-level pickle round-trip is several times faster than copy.deepcopy
+    on nested dicts, but it bypasses __deepcopy__ and rebuilds objects via
+    __reduce__, so it is only used while the state holds plain builtins;
+    any other object sends the whole snapshot through deepcopy.
+    """
+    buffer = io.BytesIO()
+    try:
+        _PlainPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(state)
+    except _NotPlainState:
+        pass
+    else:
+        return pickle.loads(buffer.getbuffer())
+    return copy.deepcopy(state)
+
+
 # ============================================================================
 # SESSION-LEVEL LOCKING
 # ============================================================================
@@ -29,51 +72,109 @@ class WorkflowLockManager:
     from interfering with each other.
     """
 
+    __slots__ = (
+        "_locks", "_lock_times", "_manager_lock",
+        "_cleanup_interval", "_lock_ttl",
+        "_stop", "_cleanup_thread", "__weakref__",
+    )
+
+    # Minimum seconds between last-use refreshes of an existing lock
+    _TOUCH_INTERVAL = 60.0
+
     def __init__(self):
         self._locks: Dict[str, threading.RLock] = {}
-        self._lock_times: Dict[str, datetime] = {}
+        # time.monotonic() of last use, oldest first
+        self._lock_times: "OrderedDict[str, float]" = OrderedDict()
         self._manager_lock = threading.Lock()
         self._cleanup_interval = 3600  # 1 hour
-        self._last_cleanup = time.time()
+        self._lock_ttl = 24 * 3600  # 24 hours
+
+        # Expired locks are swept off the request path by a daemon thread.
+        # The thread and the finalizer only hold weak references, so an
+        # unused manager is collected and its thread stops (also at exit).
+        self._stop = threading.Event()
+        self._cleanup_thread = threading.Thread(
+            target=self._cleanup_loop,
+            args=(weakref.ref(self), self._stop, self._cleanup_interval),
+            name="workflow-lock-cleanup",
+            daemon=True,
+        )
+        self._cleanup_thread.start()
+        weakref.finalize(self, self._stop.set)
 
     def get_lock(self, session_id: str) -> threading.RLock:
         """
         Get or create a lock for a specific session.
 
+        Existing locks are returned without taking the manager lock; their
+        last-use time is refreshed under it at most once per _TOUCH_INTERVAL,
+        so the refresh cannot race with cleanup. Creating a new lock is
+        serialized. Cleanup runs on a background thread.
+
         Args:
             session_id: Session identifier
 
         Returns:
             RLock for the session
         """
-        with self._manager_lock:
-            # Periodic cleanup of old locks
-            if time.time() - self._last_cleanup > self._cleanup_interval:
-                self._cleanup_old_locks()
+        lock = self._locks.get(session_id)
+        if lock is not None:
+            now = time.monotonic()
+            if now - self._lock_times.get(session_id, now) > self._TOUCH_INTERVAL:
+                with self._manager_lock:
+                    # Skip sessions cleanup evicted meanwhile, never revive them
+                    if session_id in self._lock_times:
+                        self._lock_times[session_id] = now
+                        self._lock_times.move_to_end(session_id)
+            return lock
 
-            if session_id not in self._locks:
-                self._locks[session_id] = threading.RLock()
-                self._lock_times[session_id] = datetime.now()
+        with self._manager_lock:
+            # Re-check: another thread may have created it while we waited
+            lock = self._locks.get(session_id)
+            if lock is None:
+                lock = threading.RLock()
+                self._locks[session_id] = lock
+                self._lock_times[session_id] = time.monotonic()
                 logger.debug(f"Created new lock for session {session_id}")
 
-            return self._locks[session_id]
+            return lock
+
+    @staticmethod
+    def _cleanup_loop(
+        manager_ref: "weakref.ref[WorkflowLockManager]",
+        stop: threading.Event,
+        interval: float,
+    ) -> None:
+        """Run cleanup every interval seconds until stopped or the manager is gone."""
+        while not stop.wait(interval):
+            manager = manager_ref()
+            if manager is None:
+                return
+            try:
+                with manager._manager_lock:
+                    manager._cleanup_old_locks()
+            except Exception:
+                logger.exception("Workflow lock cleanup failed")
+            del manager
+
+    def close(self) -> None:
+        """Stop the background cleanup thread."""
+        self._stop.set()
 
     def _cleanup_old_locks(self) -> None:
         """Remove locks that haven't been used in 24 hours"""
-        cutoff = datetime.now() - timedelta(hours=24)
-        expired = [
-            sid for sid, lock_time in self._lock_times.items()
-            if lock_time < cutoff
-        ]
+        cutoff = time.monotonic() - self._lock_ttl
+        lock_times = self._lock_times
+        expired = 0
 
-        for sid in expired:
-            del self._locks[sid]
-            del self._lock_times[sid]
+        # Entries are kept in last-use order, so only the expired prefix is visited
+        while lock_times and next(iter(lock_times.values())) < cutoff:
+            sid, _ = lock_times.popitem(last=False)
+            self._locks.pop(sid, None)
+            expired += 1
 
         if expired:
-            logger.info(f"Cleaned up {len(expired)} expired session locks")
-
-        self._last_cleanup = time.time()
+            logger.info(f"Cleaned up {expired} expired session locks")
 
     def release_lock(self, session_id: str) -> None:
         """
@@ -85,12 +186,25 @@ class WorkflowLockManager:
         with self._manager_lock:
             if session_id in self._locks:
                 del self._locks[session_id]
-                del self._lock_times[session_id]
+                self._lock_times.pop(session_id, None)
                 logger.debug(f"Released lock for session {session_id}")
 
 
-# Global lock manager instance
-_lock_manager = WorkflowLockManager()
+# Global lock manager instance (lazy initialization)
+_lock_manager: Optional[WorkflowLockManager] = None
+_lock_manager_init = threading.Lock()
+
+
+def _get_lock_manager() -> WorkflowLockManager:
+    """Get or create the global lock manager (double-checked locking)."""
+    global _lock_manager
+    manager = _lock_manager
+    if manager is None:
+        with _lock_manager_init:
+            manager = _lock_manager
+            if manager is None:
+                manager = _lock_manager = WorkflowLockManager()
+    return manager
 
 
 @contextmanager
@@ -113,9 +227,11 @@ def workflow_lock(session_id: str, timeout: float = 30.0):
             # Execute workflow nodes
             ...
     """
-    lock = _lock_manager.get_lock(session_id)
+    lock = _get_lock_manager().get_lock(session_id)
 
-    acquired = lock.acquire(timeout=timeout)
+    # Uncontended fast path: a non-blocking acquire skips the timed-wait
+    # setup that acquire(timeout=...) pays even when the lock is free
+    acquired = lock.acquire(blocking=False) or lock.acquire(timeout=timeout)
     if not acquired:
         raise TimeoutError(
             f"Could not acquire workflow lock for session {session_id} "
@@ -139,15 +255,23 @@ class StateTransaction:
     Provides transaction semantics for state modifications with rollback support.
     """
 
-    def __init__(self, state: Dict[str, Any], auto_commit: bool = False):
+    __slots__ = (
+        "original_state", "working_state", "auto_commit",
+        "committed", "rolled_back",
+    )
+
+    def __init__(self, state: Dict[str, Any], auto_commit: bool = False, deep: bool = True):
         """
         Initialize transaction.
 
         Args:
             state: Original state dictionary
             auto_commit: If True, automatically commit on success
+            deep: If False, snapshot only the top-level key bindings (O(keys));
+                  rollback then restores replaced/added/removed keys but not
+                  in-place mutations of nested values
         """
-        self.original_state = copy.deepcopy(state)
+        self.original_state = _snapshot_state(state) if deep else dict(state)
         self.working_state = state  # Reference to original
         self.auto_commit = auto_commit
         self.committed = False
@@ -192,13 +316,14 @@ class StateTransaction:
 
 
 @contextmanager
-def state_transaction(state: Dict[str, Any], auto_commit: bool = True):
+def state_transaction(state: Dict[str, Any], auto_commit: bool = True, deep: bool = True):
     """
     Context manager for transactional state modifications.
 
     Args:
         state: State dictionary to protect
         auto_commit: Auto-commit on success, rollback on error
+        deep: Deep-snapshot nested values (see StateTransaction)
 
     Yields:
         StateTransaction object
@@ -209,7 +334,7 @@ def state_transaction(state: Dict[str, Any], auto_commit: bool = True):
             # Automatically commits on success
             # Automatically rolls back on exception
     """
-    txn = StateTransaction(state, auto_commit=auto_commit)
+    txn = StateTransaction(state, auto_commit=auto_commit, deep=deep)
     try:
         yield txn
     except Exception as e:
@@ -224,58 +349,134 @@ def state_transaction(state: Dict[str, Any], auto_commit: bool = True):
 class ThreadSafeResultCollector:
     """
     Thread-safe collector for parallel execution results.
+
+    Backed by deques, whose append() and snapshotting via list() are atomic,
+    so writers never block each other or readers.
+
+    For plain fan-out/collect work, prefer parallel_map(), which needs no
+    shared collector at all.
     """
 
+    __slots__ = ("results", "errors")
+
     def __init__(self):
-        self.results: list = []
-        self.errors: list = []
-        self._lock = threading.Lock()
+        self.results: deque = deque()
+        self.errors: deque = deque()
 
     def add_result(self, result: Any) -> None:
         """Add a successful result"""
-        with self._lock:
-            self.results.append(result)
+        self.results.append(result)
 
     def add_error(self, error: Exception, context: Optional[Dict] = None) -> None:
-        """Add an error"""
-        with self._lock:
-            self.errors.append({
-                "error": str(error),
-                "type": type(error).__name__,
-                "context": context or {},
-                "timestamp": datetime.now().isoformat()
-            })
+        """Add an error (timestamp is formatted lazily in get_errors)"""
+        self.errors.append({
+            "error": str(error),
+            "type": type(error).__name__,
+            "context": context or {},
+            "ts": time.time()
+        })
 
     def get_results(self) -> list:
         """Get all results (thread-safe)"""
-        with self._lock:
-            return self.results.copy()
+        return list(self.results)
 
     def get_errors(self) -> list:
-        """Get all errors (thread-safe)"""
-        with self._lock:
-            return self.errors.copy()
+        """Get all errors with ISO timestamps (thread-safe)"""
+        errors = []
+        for error in list(self.errors):
+            error = dict(error)
+            error["timestamp"] = datetime.fromtimestamp(error.pop("ts")).isoformat()
+            errors.append(error)
+        return errors
 
     def has_errors(self) -> bool:
         """Check if any errors occurred"""
-        with self._lock:
-            return len(self.errors) > 0
+        return len(self.errors) > 0
 
     def summary(self) -> Dict[str, Any]:
         """Get summary statistics"""
-        with self._lock:
-            return {
-                "total_results": len(self.results),
-                "total_errors": len(self.errors),
-                "success_rate": len(self.results) / (len(self.results) + len(self.errors))
-                    if (len(self.results) + len(self.errors)) > 0 else 0.0
-            }
+        total_results = len(self.results)
+        total_errors = len(self.errors)
+        total = total_results + total_errors
+        return {
+            "total_results": total_results,
+            "total_errors": total_errors,
+            "success_rate": total_results / total if total > 0 else 0.0
+        }
+
+
+def parallel_map(
+    fn: Callable[[Any], T],
+    inputs: Iterable[Any],
+    max_workers: int = 8,
+    executor: Optional[Executor] = None,
+) -> Tuple[List[Optional[T]], List[Dict[str, Any]]]:
+    """
+    Run fn over inputs in parallel and collect results and errors.
+
+    Each task delivers its result through its own Future, so workers never
+    contend on a shared collector.
+
+    Args:
+        fn: Function applied to each input
+        inputs: Inputs to process
+        max_workers: Pool size when no executor is given
+        executor: Existing executor to submit to (not shut down here)
+
+    Returns:
+        (results aligned with inputs, with None where fn raised; errors with
+        the failing input and its index as context)
+    """
+    def collect(ex: Executor):
+        futures = [(ex.submit(fn, item), item) for item in inputs]
+        results: List[Optional[T]] = [None] * len(futures)
+        errors: List[Dict[str, Any]] = []
+        for index, (future, item) in enumerate(futures):
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                errors.append({
+                    "error": str(e),
+                    "type": type(e).__name__,
+                    "context": {"input": item, "index": index},
+                })
+        return results, errors
+
+    if executor is not None:
+        return collect(executor)
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        return collect(ex)
 
 
 # ============================================================================
 # DECORATORS
 # ============================================================================
 
+def _signature_params(func: Callable) -> list:
+    """Positional-or-keyword parameters of func, or [] if it has no signature."""
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return []
+    return [
+        p for p in parameters
+        if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)
+    ]
+
+
+def _is_state_param(param: inspect.Parameter) -> bool:
+    """True if a parameter is a workflow state dict (named state or annotated dict)."""
+    if param.kind == param.KEYWORD_ONLY:
+        return False
+    annotation = param.annotation
+    return (
+        param.name == "state"
+        or annotation in (dict, Dict, "dict")
+        or getattr(annotation, "__origin__", None) is dict
+        or (isinstance(annotation, type) and issubclass(annotation, dict))
+    )
+
+
 def with_workflow_lock(session_id_param: str = "session_id", timeout: float = 30.0):
     """
     Decorator to add workflow-level locking to functions.
@@ -291,40 +492,67 @@ def with_workflow_lock(session_id_param: str = "session_id", timeout: float = 30
             ...
     """
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            # Extract session_id from args or kwargs
-            session_id = None
-
-            # Try to get from state dict (first arg for workflow nodes)
-            if args and isinstance(args[0], dict):
-                session_id = args[0].get(session_id_param)
-
-            # Try kwargs
-            if not session_id and session_id_param in kwargs:
-                session_id = kwargs[session_id_param]
-
-            if not session_id:
-                logger.warning(
-                    f"{func.__name__} called without session_id, "
-                    "skipping workflow lock"
-                )
-                return func(*args, **kwargs)
-
-            # Acquire lock and execute
-            with workflow_lock(session_id, timeout=timeout):
-                return func(*args, **kwargs)
+        # Closure cell instead of a module-global lookup on every call
+        wf_lock = workflow_lock
+
+        def run_unlocked(args, kwargs):
+            logger.warning(
+                f"{func.__name__} called without session_id, "
+                "skipping workflow lock"
+            )
+            return func(*args, **kwargs)
+
+        # Specialize the session_id extraction once, from the signature,
+        # instead of probing every call shape on every invocation
+        params = _signature_params(func)
+
+        if params and _is_state_param(params[0]):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                state = args[0] if args else None
+                session_id = state.get(session_id_param) if isinstance(state, dict) else None
+                if not session_id:
+                    session_id = kwargs.get(session_id_param)
+                if not session_id:
+                    return run_unlocked(args, kwargs)
+                with wf_lock(session_id, timeout=timeout):
+                    return func(*args, **kwargs)
+
+        elif any(p.name == session_id_param for p in params):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                session_id = kwargs.get(session_id_param)
+                if not session_id:
+                    return run_unlocked(args, kwargs)
+                with wf_lock(session_id, timeout=timeout):
+                    return func(*args, **kwargs)
+
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                # Unknown call shape: try state dict first arg, then kwargs
+                session_id = None
+                if args and isinstance(args[0], dict):
+                    session_id = args[0].get(session_id_param)
+                if not session_id:
+                    session_id = kwargs.get(session_id_param)
+                if not session_id:
+                    return run_unlocked(args, kwargs)
+                with wf_lock(session_id, timeout=timeout):
+                    return func(*args, **kwargs)
 
         return wrapper
     return decorator
 
 
-def with_state_transaction(auto_commit: bool = True):
+def with_state_transaction(auto_commit: bool = True, deep: bool = True):
     """
     Decorator to add transaction semantics to workflow nodes.
 
     Args:
         auto_commit: Auto-commit on success
+        deep: Deep-snapshot nested values; pass False for nodes that only
+              assign top-level keys
 
     Usage:
         @with_state_transaction()
@@ -345,7 +573,7 @@ def with_state_transaction(auto_commit: bool = True):
 
             state = args[0]
 
-            with state_transaction(state, auto_commit=auto_commit):
+            with state_transaction(state, auto_commit=auto_commit, deep=deep):
                 return func(*args, **kwargs)
 
         return wrapper
@@ -358,6 +586,7 @@ __all__ = [
     'StateTransaction',
     'state_transaction',
     'ThreadSafeResultCollector',
+    'parallel_map',
     'with_workflow_lock',
     'with_state_transaction',
 ]
@@ -4,12 +4,36 @@
 # Detects user zone from IP address for zone-based storage partitioning
 # in the tree-based thread-ID workflow system.
 
+import asyncio
+import ipaddress
 import logging
 import os
+import queue
+import threading
+import time
+import weakref
 from enum import Enum
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Callable, List, Mapping
 from functools import lru_cache
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import maxminddb
+    MAXMINDDB_AVAILABLE = True
+except ImportError:
+    maxminddb = None
+    MAXMINDDB_AVAILABLE = False
+
+from .cache_manager import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -32,10 +56,22 @@ class ThreadZone(str, Enum):
     @classmethod
     def from_string(cls, value: str) -> "ThreadZone":
         """Convert string to ThreadZone with fallback to DEFAULT."""
-        try:
-            return cls(value.upper().replace(" ", "-").replace("_", "-"))
-        except ValueError:
-            return cls.DEFAULT
+        zone = _ALIAS_TO_ZONE.get(value)
+        if zone is not None:
+            return zone
+        return _ALIAS_TO_ZONE.get(
+            value.upper().replace(" ", "-").replace("_", "-"), cls.DEFAULT
+        )
+
+
+# Every upper/lower-case and -/_/space spelling of each zone, so the common
+# from_string inputs resolve with a single dict lookup
+_ALIAS_TO_ZONE: Dict[str, ThreadZone] = {
+    case(zone.value.replace("-", sep)): zone
+    for zone in ThreadZone
+    for sep in ("-", "_", " ")
+    for case in (str.upper, str.lower)
+}
 
 
 # ============================================================================
@@ -43,7 +79,7 @@ class ThreadZone(str, Enum):
 # ============================================================================
 
 # Country/region to zone mapping
-REGION_TO_ZONE: Dict[str, ThreadZone] = {
+_REGION_TO_ZONE: Dict[str, ThreadZone] = {
     # US West
     "US-CA": ThreadZone.US_WEST,  # California
     "US-WA": ThreadZone.US_WEST,  # Washington
@@ -122,7 +158,7 @@ REGION_TO_ZONE: Dict[str, ThreadZone] = {
 }
 
 # Continent fallback mapping
-CONTINENT_TO_ZONE: Dict[str, ThreadZone] = {
+_CONTINENT_TO_ZONE: Dict[str, ThreadZone] = {
     "NA": ThreadZone.US_EAST,      # North America -> US East (default)
     "SA": ThreadZone.US_EAST,      # South America -> US East
     "EU": ThreadZone.EU_CENTRAL,   # Europe -> EU Central (default)
@@ -131,6 +167,88 @@ CONTINENT_TO_ZONE: Dict[str, ThreadZone] = {
     "AF": ThreadZone.EU_WEST,      # Africa -> EU West
 }
 
+# Read-only public views; _map_to_zone reads the underlying dicts directly
+REGION_TO_ZONE: Mapping[str, ThreadZone] = MappingProxyType(_REGION_TO_ZONE)
+CONTINENT_TO_ZONE: Mapping[str, ThreadZone] = MappingProxyType(_CONTINENT_TO_ZONE)
+
+# US state names (as returned by ipinfo.io) to ISO 3166-2 subdivision codes
+# (as returned by ip-api.com and GeoLite2)
+_US_STATE_CODES: Dict[str, str] = {
+    "ALABAMA": "AL", "ALASKA": "AK", "ARIZONA": "AZ", "ARKANSAS": "AR",
+    "CALIFORNIA": "CA", "COLORADO": "CO", "CONNECTICUT": "CT", "DELAWARE": "DE",
+    "DISTRICT OF COLUMBIA": "DC", "FLORIDA": "FL", "GEORGIA": "GA", "HAWAII": "HI",
+    "IDAHO": "ID", "ILLINOIS": "IL", "INDIANA": "IN", "IOWA": "IA",
+    "KANSAS": "KS", "KENTUCKY": "KY", "LOUISIANA": "LA", "MAINE": "ME",
+    "MARYLAND": "MD", "MASSACHUSETTS": "MA", "MICHIGAN": "MI", "MINNESOTA": "MN",
+    "MISSISSIPPI": "MS", "MISSOURI": "MO", "MONTANA": "MT", "NEBRASKA": "NE",
+    "NEVADA": "NV", "NEW HAMPSHIRE": "NH", "NEW JERSEY": "NJ", "NEW MEXICO": "NM",
+    "NEW YORK": "NY", "NORTH CAROLINA": "NC", "NORTH DAKOTA": "ND", "OHIO": "OH",
+    "OKLAHOMA": "OK", "OREGON": "OR", "PENNSYLVANIA": "PA", "RHODE ISLAND": "RI",
+    "SOUTH CAROLINA": "SC", "SOUTH DAKOTA": "SD", "TENNESSEE": "TN", "TEXAS": "TX",
+    "UTAH": "UT", "VERMONT": "VT", "VIRGINIA": "VA", "WASHINGTON": "WA",
+    "WEST VIRGINIA": "WV", "WISCONSIN": "WI", "WYOMING": "WY",
+}
+
+# IANA timezone area to continent code. Neither web provider reports a
+# continent by default, but both report the timezone, so deriving it from
+# there gives the same answer whichever provider responds. "America" maps to
+# NA; CONTINENT_TO_ZONE sends NA and SA to the same zone.
+_TIMEZONE_AREA_TO_CONTINENT: Dict[str, str] = {
+    "America": "NA",
+    "Europe": "EU",
+    "Asia": "AS",
+    "Indian": "AS",
+    "Australia": "OC",
+    "Pacific": "OC",
+    "Africa": "AF",
+}
+
+
+def _normalize_geo(
+    country: Optional[str],
+    region: Optional[str],
+    timezone: Optional[str],
+    city: Optional[str],
+    source: str,
+) -> Dict[str, Any]:
+    """
+    Build provider-independent geo data.
+
+    country is an ISO 3166-1 alpha-2 code; region is the US state code (empty
+    elsewhere, where it is not used for zoning), given either as a code or a
+    full state name; continent is derived from the timezone.
+    """
+    country = (country or "").upper()
+    region = (region or "").upper()
+    if country == "US":
+        region = region if len(region) == 2 else _US_STATE_CODES.get(region, "")
+    else:
+        region = ""
+    timezone = timezone or ""
+    return {
+        "country": country,
+        "region": region,
+        "city": city or "",
+        "timezone": timezone,
+        "continent": _TIMEZONE_AREA_TO_CONTINENT.get(timezone.partition("/")[0], ""),
+        "source": source,
+    }
+
+
+@lru_cache(maxsize=4096)
+def _is_local_address(ip: str) -> bool:
+    """
+    Check if an address is loopback, private or link-local (IPv4 or IPv6).
+
+    Parsed with ipaddress so the range checks are exact; memoized because
+    the same client IPs recur across requests.
+    """
+    try:
+        addr = ipaddress.ip_address(ip)
+    except ValueError:
+        return ip == "localhost"
+    return addr.is_private or addr.is_loopback or addr.is_link_local
+
 
 # ============================================================================
 # ZONE DETECTOR CLASS
@@ -141,20 +259,28 @@ class ZoneDetector:
     Detects user zone from IP address using IP geolocation services.
 
     Supports multiple geolocation providers with fallback:
-    1. ipinfo.io (default)
-    2. ip-api.com (fallback)
+    1. Local GeoLite2 database (if maxminddb and the .mmdb file are available)
+    2. ipinfo.io
+    3. ip-api.com (fallback)
 
     Results are cached to minimize API calls.
     """
 
-    IPINFO_API_URL = "https://ipinfo.io/{ip}/json"
-    IPAPI_URL = "http://ip-api.com/json/{ip}"
+    __slots__ = ("ipinfo_token", "timeout", "_cache", "_session", "_mmdb", "_aio_sessions")
+
+    DEFAULT_GEOIP_DB_PATH = "/opt/geolite2/GeoLite2-Country.mmdb"
+    IPINFO_API_URL = "https://ipinfo.io/%s/json"
+    IPAPI_URL = "http://ip-api.com/json/%s"
+    IPAPI_BATCH_URL = "http://ip-api.com/batch"
+    IPAPI_BATCH_SIZE = 100  # ip-api.com accepts at most 100 queries per batch
 
     def __init__(
         self,
         ipinfo_token: Optional[str] = None,
         cache_ttl_seconds: int = 3600,
         timeout_seconds: int = 5,
+        cache_max_size: int = 10_000,
+        geoip_db_path: Optional[str] = None,
     ):
         """
         Initialize zone detector.
@@ -163,10 +289,40 @@ class ZoneDetector:
             ipinfo_token: Optional token for ipinfo.io (increases rate limits)
             cache_ttl_seconds: Cache TTL for IP lookups (default 1 hour)
             timeout_seconds: Request timeout in seconds
+            cache_max_size: Maximum number of cached IP lookups (LRU-evicted)
+            geoip_db_path: Path to a GeoLite2 Country/City .mmdb file
+                (default: GEOIP_DB_PATH env var or DEFAULT_GEOIP_DB_PATH)
         """
         self.ipinfo_token = ipinfo_token or os.getenv("IPINFO_TOKEN")
         self.timeout = timeout_seconds
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._cache = TTLCache(ttl_seconds=cache_ttl_seconds, max_size=cache_max_size)
+
+        # Pooled session so repeated lookups reuse TCP/TLS connections; one
+        # attempt per request, so a lookup is bounded by a single timeout
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=0)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # One aiohttp session per event loop (sessions are loop-bound)
+        self._aio_sessions: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+        self._mmdb = self._open_mmdb(
+            geoip_db_path or os.getenv("GEOIP_DB_PATH", self.DEFAULT_GEOIP_DB_PATH)
+        )
+
+    @staticmethod
+    def _open_mmdb(path: str):
+        """Open the GeoLite2 database memory-mapped, or return None if unavailable."""
+        if not MAXMINDDB_AVAILABLE or not os.path.isfile(path):
+            return None
+        try:
+            reader = maxminddb.open_database(path, maxminddb.MODE_MMAP)
+            logger.info(f"[ZONE_DETECTOR] Using local GeoIP database: {path}")
+            return reader
+        except (OSError, ValueError) as e:
+            logger.warning(f"[ZONE_DETECTOR] Could not open GeoIP database {path}: {e}")
+            return None
 
     def detect_zone(self, ip_address: str) -> ThreadZone:
         """
@@ -179,7 +335,7 @@ class ZoneDetector:
             ThreadZone based on IP geolocation
         """
         # Handle localhost/private IPs
-        if self._is_local_ip(ip_address):
+        if _is_local_address(ip_address):
             logger.debug(f"[ZONE_DETECTOR] Local IP detected: {ip_address}")
             return self._get_default_zone()
 
@@ -193,27 +349,98 @@ class ZoneDetector:
         geo_data = self._lookup_ip(ip_address)
         if geo_data:
             zone = self._map_to_zone(geo_data)
-            self._cache[ip_address] = {"zone": zone, "geo_data": geo_data}
+            self._cache.set(ip_address, {"zone": zone, "geo_data": geo_data})
+            logger.info(f"[ZONE_DETECTOR] IP {ip_address} -> Zone {zone.value}")
+            return zone
+
+        logger.warning(f"[ZONE_DETECTOR] Failed to detect zone for IP: {ip_address}")
+        return ThreadZone.DEFAULT
+
+    async def detect_zone_async(self, ip_address: str) -> ThreadZone:
+        """
+        Detect zone from IP address without blocking the event loop.
+
+        On a cache miss both providers are queried concurrently and the first
+        successful answer wins. Falls back to the sync path in a worker thread
+        when aiohttp is not installed.
+
+        Args:
+            ip_address: The client IP address
+
+        Returns:
+            ThreadZone based on IP geolocation
+        """
+        if not AIOHTTP_AVAILABLE:
+            return await asyncio.to_thread(self.detect_zone, ip_address)
+
+        if _is_local_address(ip_address):
+            return self._get_default_zone()
+
+        cached = self._cache.get(ip_address)
+        if cached:
+            return cached.get("zone", ThreadZone.DEFAULT)
+
+        geo_data = self._lookup_mmdb(ip_address) or await self._lookup_ip_async(ip_address)
+        if geo_data:
+            zone = self._map_to_zone(geo_data)
+            self._cache.set(ip_address, {"zone": zone, "geo_data": geo_data})
             logger.info(f"[ZONE_DETECTOR] IP {ip_address} -> Zone {zone.value}")
             return zone
 
         logger.warning(f"[ZONE_DETECTOR] Failed to detect zone for IP: {ip_address}")
         return ThreadZone.DEFAULT
 
+    def detect_zones(self, ip_addresses: List[str]) -> Dict[str, ThreadZone]:
+        """
+        Detect zones for many IP addresses at once.
+
+        Local and cached IPs are resolved without I/O; the remaining IPs are
+        looked up through the ip-api.com batch endpoint (up to 100 per request).
+
+        Args:
+            ip_addresses: Client IP addresses
+
+        Returns:
+            Mapping of IP address to ThreadZone
+        """
+        zones: Dict[str, ThreadZone] = {}
+        pending: List[str] = []
+
+        for ip in dict.fromkeys(ip_addresses):
+            if _is_local_address(ip):
+                zones[ip] = self._get_default_zone()
+                continue
+            cached = self._cache.get(ip)
+            if cached:
+                zones[ip] = cached.get("zone", ThreadZone.DEFAULT)
+                continue
+            geo_data = self._lookup_mmdb(ip)
+            if geo_data:
+                zone = self._map_to_zone(geo_data)
+                self._cache.set(ip, {"zone": zone, "geo_data": geo_data})
+                zones[ip] = zone
+            else:
+                pending.append(ip)
+
+        for start in range(0, len(pending), self.IPAPI_BATCH_SIZE):
+            chunk = pending[start:start + self.IPAPI_BATCH_SIZE]
+            results = self._lookup_ipapi_batch(chunk)
+            for ip in chunk:
+                geo_data = results.get(ip)
+                if geo_data:
+                    zone = self._map_to_zone(geo_data)
+                    self._cache.set(ip, {"zone": zone, "geo_data": geo_data})
+                    zones[ip] = zone
+                else:
+                    zones[ip] = ThreadZone.DEFAULT
+
+        if pending:
+            logger.info(f"[ZONE_DETECTOR] Batch-resolved {len(pending)} IPs")
+        return zones
+
     def _is_local_ip(self, ip: str) -> bool:
         """Check if IP is localhost or private."""
-        local_prefixes = [
-            "127.",
-            "10.",
-            "172.16.", "172.17.", "172.18.", "172.19.",
-            "172.20.", "172.21.", "172.22.", "172.23.",
-            "172.24.", "172.25.", "172.26.", "172.27.",
-            "172.28.", "172.29.", "172.30.", "172.31.",
-            "192.168.",
-            "::1",
-            "fe80:",
-        ]
-        return any(ip.startswith(prefix) for prefix in local_prefixes) or ip == "localhost"
+        return _is_local_address(ip)
 
     def _get_default_zone(self) -> ThreadZone:
         """Get default zone from environment or config."""
@@ -224,40 +451,155 @@ class ZoneDetector:
         """
         Look up IP geolocation using available services.
 
-        Tries ipinfo.io first, then falls back to ip-api.com.
+        Tries the local GeoIP database first, then races ipinfo.io and
+        ip-api.com and returns the first successful answer, so a slow or
+        failing provider costs at most one timeout. Both providers are
+        normalized to the same schema, so the zone does not depend on
+        which one answers first.
         """
-        # Try ipinfo.io
-        geo_data = self._lookup_ipinfo(ip)
+        # Try local database (no network I/O)
+        geo_data = self._lookup_mmdb(ip)
         if geo_data:
             return geo_data
 
-        # Fallback to ip-api.com
-        geo_data = self._lookup_ipapi(ip)
-        if geo_data:
-            return geo_data
+        # One daemon thread per provider: nothing shared can be exhausted by
+        # hung requests, and an abandoned request never delays shutdown
+        answers: queue.SimpleQueue = queue.SimpleQueue()
+        providers = (self._lookup_ipinfo, self._lookup_ipapi)
+        for lookup in providers:
+            threading.Thread(
+                target=self._post_lookup,
+                args=(lookup, ip, answers),
+                name="zone-lookup",
+                daemon=True,
+            ).start()
+
+        deadline = time.monotonic() + self.timeout
+        for _ in providers:
+            try:
+                geo_data = answers.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                logger.warning(f"[ZONE_DETECTOR] Geolocation lookups timed out for IP: {ip}")
+                break
+            if geo_data:
+                return geo_data
+
+        return None
+
+    @staticmethod
+    def _post_lookup(lookup: Callable, ip: str, answers: queue.SimpleQueue) -> None:
+        """Run one provider lookup and post its result (None on failure)."""
+        try:
+            answers.put(lookup(ip))
+        except Exception as e:
+            logger.warning(f"[ZONE_DETECTOR] Geolocation lookup failed: {e}")
+            answers.put(None)
+
+    def _lookup_mmdb(self, ip: str) -> Optional[Dict[str, Any]]:
+        """Look up IP in the local GeoLite2 database."""
+        if self._mmdb is None:
+            return None
+        try:
+            record = self._mmdb.get(ip)
+        except ValueError as e:
+            logger.debug(f"[ZONE_DETECTOR] GeoIP database lookup failed: {e}")
+            return None
+
+        if not record:
+            return None
+        country = (record.get("country") or record.get("registered_country") or {}).get("iso_code", "")
+        continent = (record.get("continent") or {}).get("code", "")
+        if not country and not continent:
+            return None
+        # Only City databases carry subdivisions (US state codes)
+        subdivisions = record.get("subdivisions") or [{}]
+        return {
+            "country": country,
+            "region": subdivisions[0].get("iso_code", ""),
+            "continent": continent,
+            "source": "geolite2",
+        }
+
+    def _get_aio_session(self):
+        """Get this event loop's pooled aiohttp session, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        session = self._aio_sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._aio_sessions[loop] = session
+        return session
+
+    async def aclose(self) -> None:
+        """Close the current event loop's aiohttp session (call before the loop ends)."""
+        session = self._aio_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+    async def _lookup_ip_async(self, ip: str) -> Optional[Dict[str, Any]]:
+        """
+        Race ipinfo.io and ip-api.com; return the first successful result.
+
+        Both answers are normalized to the same schema (see _lookup_ip).
+        """
+        session = self._get_aio_session()
+        pending = {
+            asyncio.ensure_future(self._lookup_ipinfo_async(session, ip)),
+            asyncio.ensure_future(self._lookup_ipapi_async(session, ip)),
+        }
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    geo_data = task.result()
+                    if geo_data:
+                        return geo_data
+        finally:
+            for task in pending:
+                task.cancel()
+
+        return None
+
+    async def _lookup_ipinfo_async(self, session, ip: str) -> Optional[Dict[str, Any]]:
+        """Look up IP using ipinfo.io (async)."""
+        try:
+            url = self.IPINFO_API_URL % ip
+            params = {"token": self.ipinfo_token} if self.ipinfo_token else {}
+            async with session.get(url, params=params) as response:
+                if response.status == 200:
+                    return self._parse_ipinfo(await response.json(content_type=None))
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logger.warning(f"[ZONE_DETECTOR] ipinfo.io async lookup failed: {e}")
+
+        return None
+
+    async def _lookup_ipapi_async(self, session, ip: str) -> Optional[Dict[str, Any]]:
+        """Look up IP using ip-api.com (async)."""
+        try:
+            url = self.IPAPI_URL % ip
+            async with session.get(url) as response:
+                if response.status == 200:
+                    return self._parse_ipapi(await response.json(content_type=None))
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logger.warning(f"[ZONE_DETECTOR] ip-api.com async lookup failed: {e}")
 
         return None
 
     def _lookup_ipinfo(self, ip: str) -> Optional[Dict[str, Any]]:
         """Look up IP using ipinfo.io."""
         try:
-            url = self.IPINFO_API_URL.format(ip=ip)
+            url = self.IPINFO_API_URL % ip
             params = {}
             if self.ipinfo_token:
                 params["token"] = self.ipinfo_token
 
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = self._session.get(url, params=params, timeout=self.timeout)
 
             if response.status_code == 200:
-                data = response.json()
-                return {
-                    "country": data.get("country", ""),
-                    "region": data.get("region", ""),
-                    "city": data.get("city", ""),
-                    "loc": data.get("loc", ""),
-                    "timezone": data.get("timezone", ""),
-                    "source": "ipinfo.io",
-                }
+                return self._parse_ipinfo(response.json())
         except requests.RequestException as e:
             logger.warning(f"[ZONE_DETECTOR] ipinfo.io lookup failed: {e}")
 
@@ -266,47 +608,71 @@ class ZoneDetector:
     def _lookup_ipapi(self, ip: str) -> Optional[Dict[str, Any]]:
         """Look up IP using ip-api.com (free fallback)."""
         try:
-            url = self.IPAPI_URL.format(ip=ip)
-            response = requests.get(url, timeout=self.timeout)
+            url = self.IPAPI_URL % ip
+            response = self._session.get(url, timeout=self.timeout)
 
             if response.status_code == 200:
-                data = response.json()
-                if data.get("status") == "success":
-                    return {
-                        "country": data.get("countryCode", ""),
-                        "region": data.get("region", ""),
-                        "city": data.get("city", ""),
-                        "timezone": data.get("timezone", ""),
-                        "continent": data.get("continent", ""),
-                        "source": "ip-api.com",
-                    }
+                return self._parse_ipapi(response.json())
         except requests.RequestException as e:
             logger.warning(f"[ZONE_DETECTOR] ip-api.com lookup failed: {e}")
 
         return None
 
+    def _lookup_ipapi_batch(self, ips: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Look up up to 100 IPs in one request using the ip-api.com batch endpoint."""
+        results: Dict[str, Dict[str, Any]] = {}
+        try:
+            response = self._session.post(
+                self.IPAPI_BATCH_URL,
+                json=[{"query": ip} for ip in ips],
+                timeout=self.timeout,
+            )
+
+            if response.status_code == 200:
+                for data in response.json():
+                    geo_data = self._parse_ipapi(data)
+                    if geo_data:
+                        results[data.get("query", "")] = geo_data
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"[ZONE_DETECTOR] ip-api.com batch lookup failed: {e}")
+
+        return results
+
+    @staticmethod
+    def _parse_ipinfo(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Normalize an ipinfo.io response to geo data."""
+        if not data.get("country"):
+            return None
+        geo_data = _normalize_geo(
+            data.get("country"), data.get("region"), data.get("timezone"),
+            data.get("city"), "ipinfo.io",
+        )
+        geo_data["loc"] = data.get("loc", "")
+        return geo_data
+
+    @staticmethod
+    def _parse_ipapi(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Normalize an ip-api.com response record to geo data."""
+        if data.get("status") != "success":
+            return None
+        return _normalize_geo(
+            data.get("countryCode"), data.get("region"), data.get("timezone"),
+            data.get("city"), "ip-api.com",
+        )
+
     def _map_to_zone(self, geo_data: Dict[str, Any]) -> ThreadZone:
         """Map geolocation data to a ThreadZone."""
-        country = geo_data.get("country", "")
+        country = (geo_data.get("country") or "").upper()
         region = geo_data.get("region", "")
-        continent = geo_data.get("continent", "")
-
-        # Try country + region (for US states)
-        if country == "US" and region:
-            region_key = f"US-{region[:2].upper()}"
-            if region_key in REGION_TO_ZONE:
-                return REGION_TO_ZONE[region_key]
-
-        # Try country only
-        if country in REGION_TO_ZONE:
-            return REGION_TO_ZONE[country]
-
-        # Try continent fallback
-        if continent in CONTINENT_TO_ZONE:
-            return CONTINENT_TO_ZONE[continent]
 
-        # Default
-        return ThreadZone.DEFAULT
+        # Country + region (US states only have composite keys), then
+        # country only, then continent fallback
+        return (
+            (country == "US" and region and _REGION_TO_ZONE.get(f"US-{region.upper()}"))
+            or _REGION_TO_ZONE.get(country)
+            or _CONTINENT_TO_ZONE.get((geo_data.get("continent") or "").upper())
+            or ThreadZone.DEFAULT
+        )
 
 
 # ============================================================================
@@ -315,14 +681,19 @@ class ZoneDetector:
 
 # Global detector instance (lazy initialization)
 _detector: Optional[ZoneDetector] = None
+_detector_init = threading.Lock()
 
 
 def get_zone_detector() -> ZoneDetector:
-    """Get or create the global zone detector instance."""
+    """Get or create the global zone detector instance (thread-safe)."""
     global _detector
-    if _detector is None:
-        _detector = ZoneDetector()
-    return _detector
+    detector = _detector
+    if detector is None:
+        with _detector_init:
+            detector = _detector
+            if detector is None:
+                detector = _detector = ZoneDetector()
+    return detector
 
 
 def detect_zone_from_ip(ip_address: str) -> ThreadZone:
@@ -338,6 +709,19 @@ def detect_zone_from_ip(ip_address: str) -> ThreadZone:
     return get_zone_detector().detect_zone(ip_address)
 
 
+async def detect_zone_from_ip_async(ip_address: str) -> ThreadZone:
+    """
+    Async variant of detect_zone_from_ip for use inside an event loop.
+
+    Args:
+        ip_address: The client IP address
+
+    Returns:
+        ThreadZone based on IP geolocation
+    """
+    return await get_zone_detector().detect_zone_async(ip_address)
+
+
 def detect_zone_from_request(request) -> ThreadZone:
     """
     Detect zone from Flask request object.
@@ -409,6 +793,7 @@ __all__ = [
     "ZoneDetector",
     "get_zone_detector",
     "detect_zone_from_ip",
+    "detect_zone_from_ip_async",
     "detect_zone_from_request",
     "get_zone_from_header",
     "resolve_zone",